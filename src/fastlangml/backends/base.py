@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
+import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DetectionResult:
     """Result from a single backend detection."""
 
@@ -17,11 +18,13 @@ class DetectionResult:
     is_reliable: bool = True  # Backend-specific reliability flag
 
     def __post_init__(self) -> None:
-        # Normalize language code to lowercase
-        self.language = self.language.lower() if self.language else "unknown"
+        # Normalize language code to lowercase; interned so the voting dicts
+        # compare codes by identity instead of by value
+        language = sys.intern(self.language.lower()) if self.language else "unknown"
+        object.__setattr__(self, "language", language)
         # Ensure all_probabilities includes the top result
-        if self.language != "unknown" and self.language not in self.all_probabilities:
-            self.all_probabilities[self.language] = self.confidence
+        if language != "unknown" and language not in self.all_probabilities:
+            self.all_probabilities[language] = self.confidence
 
 
 class Backend(ABC):
@@ -1,17 +1,141 @@
 """Caching utilities for language detection results.
 
-Uses cachetools for efficient LRU caching of detection results,
-especially useful for repeated short strings like "ok", "thanks", etc.
+Provides a small LRU cache for detection results, especially useful for
+repeated short strings like "ok", "thanks", etc.
 """
 
 from __future__ import annotations
 
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
 from typing import Any
 
 from cachetools import LRUCache
 
+_MISSING = object()
+
+# Don't split a cache so finely that shards hold fewer entries than this;
+# tiny shards make eviction order noticeably non-global.
+_MIN_SHARD_SIZE = 32
+
+
+class _CacheShard:
+    """One independently locked LRU segment of a DetectionCache."""
+
+    __slots__ = ("maxsize", "hits", "misses", "data", "lock")
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.data: OrderedDict[Hashable, Any] = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any) -> Any:
+        with self.lock:
+            value = self.data.get(key, _MISSING)
+            if value is _MISSING:
+                self.misses += 1
+                return default
+            self.data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        with self.lock:
+            data = self.data
+            if key in data:
+                data.move_to_end(key)
+            data[key] = value
+            if len(data) > self.maxsize:
+                data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self.lock:
+            self.data.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+class DetectionCache:
+    """LRU cache for detection results.
+
+    Built directly on ``OrderedDict.move_to_end`` so a hit costs one dict
+    lookup and one relink. ``detect_batch`` calls into the cache from worker
+    threads, so entries are spread over independently locked shards by key
+    hash to keep workers from serializing on a single lock. Eviction is LRU
+    within each shard.
+
+    Args:
+        max_size: Maximum number of entries to cache (split as evenly as
+            possible across shards). Zero or less disables caching.
+        num_shards: Upper bound on the number of shards (power of two).
+            Small caches use fewer shards.
+
+    Example:
+        >>> cache = DetectionCache(max_size=2)
+        >>> cache.put("ok", "en")
+        >>> cache.get("ok")
+        'en'
+    """
+
+    def __init__(self, max_size: int = 1000, num_shards: int = 16) -> None:
+        if num_shards < 1 or num_shards & (num_shards - 1):
+            raise ValueError(f"num_shards must be a power of two, got {num_shards}")
+        while num_shards > 1 and max_size < num_shards * _MIN_SHARD_SIZE:
+            num_shards //= 2
+
+        self.maxsize = max_size
+        self._mask = num_shards - 1
+        # Hand the remainder to the first shards so capacities sum to max_size
+        base, extra = divmod(max(max_size, 0), num_shards)
+        self._shards = [_CacheShard(base + (i < extra)) for i in range(num_shards)]
+
+    def _shard(self, key: Hashable) -> _CacheShard:
+        return self._shards[hash(key) & self._mask]
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for ``key`` and mark it recently used."""
+        return self._shard(key).get(key, default)
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store ``value`` under ``key``, evicting the least recently used entry."""
+        if self.maxsize <= 0:
+            return
+        self._shard(key).put(key, value)
+
+    def clear(self) -> None:
+        """Remove all entries and reset hit/miss counters."""
+        for shard in self._shards:
+            shard.clear()
+
+    @property
+    def hits(self) -> int:
+        return sum(shard.hits for shard in self._shards)
+
+    @property
+    def misses(self) -> int:
+        return sum(shard.misses for shard in self._shards)
+
+    def stats(self) -> dict[str, int]:
+        """Return size, maxsize, hits and misses."""
+        return {
+            "size": len(self),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def __len__(self) -> int:
+        return sum(len(shard.data) for shard in self._shards)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._shard(key).data
+
+
 # Default cache for detection results
-_default_cache: LRUCache[str, Any] = LRUCache(maxsize=1000)
+_default_cache = DetectionCache(max_size=1000)
 
 
 def get_cache(max_size: int = 1000) -> LRUCache[str, Any]:
@@ -26,10 +150,28 @@ def get_cache(max_size: int = 1000) -> LRUCache[str, Any]:
     return LRUCache(maxsize=max_size)
 
 
+def get_detection_cache(max_size: int = 1000) -> DetectionCache:
+    """Create a sharded, thread-safe detection result cache.
+
+    Args:
+        max_size: Maximum number of entries to cache.
+
+    Returns:
+        DetectionCache instance.
+    """
+    return DetectionCache(max_size=max_size)
+
+
 def clear_default_cache() -> None:
     """Clear the default detection cache."""
     _default_cache.clear()
 
 
 # Export for convenience
-__all__ = ["LRUCache", "get_cache", "clear_default_cache"]
+__all__ = [
+    "DetectionCache",
+    "LRUCache",
+    "get_cache",
+    "get_detection_cache",
+    "clear_default_cache",
+]
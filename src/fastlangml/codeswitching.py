@@ -16,7 +16,7 @@ if TYPE_CHECKING:
     from fastlangml.backends import Backend
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CodeSwitchSpan:
     """A span of text in a specific language within a mixed-language message."""
 
@@ -36,7 +36,7 @@ class CodeSwitchSpan:
     """End character position in original text."""
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CodeSwitchResult:
     """Result of code-switching detection."""
 
@@ -163,6 +163,7 @@ class CodeSwitchDetector:
         # Detect language for each word
         spans: list[CodeSwitchSpan] = []
         lang_counts: dict[str, int] = {}
+        conf_total = 0.0
 
         for word, start, end in words_with_pos:
             if self._backend is None:
@@ -183,11 +184,12 @@ class CodeSwitchDetector:
                             end=end,
                         )
                     )
+                    conf_total += conf
                     lang_counts[lang] = lang_counts.get(lang, 0) + 1
             except Exception:
                 pass
 
-        return self._build_result(text, spans, lang_counts)
+        return self._build_result(spans, lang_counts, conf_total)
 
     def _detect_segment_level(self, text: str) -> CodeSwitchResult:
         """Detect code-switching at segment level (sentence/clause)."""
@@ -197,6 +199,7 @@ class CodeSwitchDetector:
 
         spans: list[CodeSwitchSpan] = []
         lang_counts: dict[str, int] = {}
+        conf_total = 0.0
         pos = 0
 
         for segment in segments:
@@ -226,19 +229,20 @@ class CodeSwitchDetector:
                             end=end,
                         )
                     )
+                    conf_total += conf
                     lang_counts[lang] = lang_counts.get(lang, 0) + len(segment)
             except Exception:
                 pos = text.find(segment, pos) + len(segment)
 
-        return self._build_result(text, spans, lang_counts)
+        return self._build_result(spans, lang_counts, conf_total)
 
     def _build_result(
         self,
-        text: str,
         spans: list[CodeSwitchSpan],
         lang_counts: dict[str, int],
+        conf_total: float,
     ) -> CodeSwitchResult:
-        """Build the final result from spans and counts."""
+        """Build the final result from spans, counts and summed span confidence."""
         if not lang_counts:
             return CodeSwitchResult(
                 is_mixed=False,
@@ -263,7 +267,7 @@ class CodeSwitchDetector:
         is_mixed = len(sorted_langs) > 1 and sorted_langs[1][1] >= 0.15
 
         # Calculate overall confidence
-        avg_conf = sum(s.confidence for s in spans) / len(spans) if spans else 0.0
+        avg_conf = conf_total / len(spans) if spans else 0.0
 
         return CodeSwitchResult(
             is_mixed=is_mixed,
@@ -326,6 +330,16 @@ CODE_SWITCH_PATTERNS: dict[tuple[str, str], list[str]] = {
 }
 
 
+# CODE_SWITCH_PATTERNS compiled once at import: one alternation per language
+# pair so each pair costs a single scan of the text. Pairs stay separate (and
+# ordered) so the first matching pair wins, as when patterns are tried singly.
+_PAIR_MATCHERS: tuple[tuple[tuple[str, str], re.Pattern[str]], ...] = tuple(
+    (pair, re.compile("|".join(f"(?:{pattern})" for pattern in patterns), re.IGNORECASE))
+    for pair, patterns in CODE_SWITCH_PATTERNS.items()
+    if patterns
+)
+
+
 def detect_code_switching_pattern(text: str) -> tuple[str, str] | None:
     """Detect if text matches known code-switching patterns.
 
@@ -336,10 +350,9 @@ def detect_code_switching_pattern(text: str) -> tuple[str, str] | None:
         Tuple of (lang1, lang2) if pattern matched, None otherwise
     """
     text_lower = text.lower()
-    for (lang1, lang2), patterns in CODE_SWITCH_PATTERNS.items():
-        for pattern in patterns:
-            if re.search(pattern, text_lower, re.IGNORECASE):
-                return (lang1, lang2)
+    for pair, matcher in _PAIR_MATCHERS:
+        if matcher.search(text_lower):
+            return pair
     return None
 
 
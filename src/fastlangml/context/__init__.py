@@ -1,6 +1,7 @@
 """Conversation context management for improved detection accuracy."""
 
 from fastlangml.context.conversation import ConversationContext, ConversationTurn
+from fastlangml.context.memory_store import MemoryContextStore
 
 # Optional stores (require extra deps)
 try:
@@ -17,5 +18,6 @@ __all__ = [
     "ConversationContext",
     "ConversationTurn",
     "DiskContextStore",
+    "MemoryContextStore",
     "RedisContextStore",
 ]
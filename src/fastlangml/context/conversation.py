@@ -6,21 +6,35 @@ accuracy for subsequent messages.
 
 from __future__ import annotations
 
+import sys
+import threading
 import time
-from collections import deque
-from collections.abc import Iterator
+from array import array
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any
 
+from fastlangml.context.serialization import dumps, loads
 
-@dataclass
+
+@dataclass(slots=True)
 class ConversationTurn:
     """A single turn in a conversation."""
 
     text: str
     detected_language: str | None = None
     confidence: float = 0.0
-    timestamp: float = field(default_factory=time.time)
+    timestamp: float = 0.0
+    """Wall-clock time of the turn (0.0 when the context doesn't track time)."""
+
+    def _to_tuple(self) -> tuple[str, str | None, float, float]:
+        """Compact ``(text, language, confidence, timestamp)`` record."""
+        return (self.text, self.detected_language, self.confidence, self.timestamp)
+
+    @classmethod
+    def _from_tuple(cls, record: tuple[str, str | None, float, float]) -> ConversationTurn:
+        return cls(*record)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
@@ -38,11 +52,11 @@ class ConversationTurn:
             text=data["text"],
             detected_language=data.get("detected_language"),
             confidence=data.get("confidence", 0.0),
-            timestamp=data.get("timestamp", time.time()),
+            timestamp=data["timestamp"] if "timestamp" in data else time.time(),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ConversationContext:
     """Manages conversation history for context-aware language detection.
 
@@ -59,6 +73,7 @@ class ConversationContext:
             automatically discarded. Defaults to 20.
         decay_factor: Exponential decay factor for recency weighting (0-1).
             Higher values give more weight to recent turns. Defaults to 0.9.
+        use_timestamps: Record wall-clock time per turn. Defaults to False.
 
     Example:
         >>> context = ConversationContext(max_turns=10)
@@ -80,10 +95,82 @@ class ConversationContext:
     decay_factor: float = 0.9
     """Decay factor for recency weighting (0-1). Higher = more recency bias."""
 
-    _turns: deque[ConversationTurn] = field(default_factory=deque)
+    use_timestamps: bool = False
+    """Record wall-clock time for each turn. Off by default since detection
+    only uses turn order; timestamps are then 0.0."""
+
+    # Fixed-size circular buffer stored column-wise (one slot per turn in
+    # each column). Capacity is max_turns rounded up to a power of two so
+    # slot arithmetic is a bitmask; only the last _window slots before _head
+    # hold live turns. _head is the next slot to write, _count how many are
+    # live. ConversationTurn objects are only built when turns are read.
+    _texts: list[str] = field(default_factory=list, init=False, repr=False, compare=False)
+    _langs: list[str | None] = field(default_factory=list, init=False, repr=False, compare=False)
+    _confs: array[float] = field(
+        default_factory=lambda: array("d"), init=False, repr=False, compare=False
+    )
+    _timestamps: array[float] = field(
+        default_factory=lambda: array("d"), init=False, repr=False, compare=False
+    )
+    _window: int = field(default=0, init=False, repr=False, compare=False)
+    _mask: int = field(default=0, init=False, repr=False, compare=False)
+    _head: int = field(default=0, init=False, repr=False, compare=False)
+    _count: int = field(default=0, init=False, repr=False, compare=False)
+
+    # Bumped on every mutation; derived views are memoized against it
+    _version: int = field(default=0, init=False, repr=False, compare=False)
+    _dist_cache: tuple[int, dict[str, float]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _boost_cache: dict[str, float] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _boost_version: int = field(default=-1, init=False, repr=False, compare=False)
+
+    # Running recency-weighted confidence per language, plus how many turns
+    # in the window carry each language (all, and with confidence > 0) so
+    # that evicted contributions drop out exactly instead of leaving
+    # floating-point residue
+    _weighted_counts: dict[str, float] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _lang_counts: dict[str, int] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _positive_counts: dict[str, int] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    # Values published by writers for lock-free readers: the language with
+    # the highest running weight, and the (language, length) run of
+    # identical languages ending at the most recent turn. Each is replaced
+    # by a single attribute store, so readers never see a torn value.
+    _dominant: str | None = field(default=None, init=False, repr=False, compare=False)
+    _streak: tuple[str | None, int] = field(
+        default=(None, 0), init=False, repr=False, compare=False
+    )
+
+    # Serializes mutations and multi-field snapshots so concurrent add_turn
+    # calls on a shared context never lose turns or tear the ring buffer
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
-        self._turns = deque(maxlen=self.max_turns)
+        self._allocate(max(self.max_turns, 0))
+
+    def _allocate(self, window: int) -> None:
+        capacity = 1 << (window - 1).bit_length() if window else 0
+        self._texts = [""] * capacity
+        self._langs = [None] * capacity
+        self._confs = array("d", bytes(8 * capacity))
+        self._timestamps = array("d", bytes(8 * capacity))
+        self._window = window
+        self._mask = capacity - 1
+        self._head = 0
+        self._count = 0
+        self._dominant = None
+        self._streak = (None, 0)
 
     def add_turn(
         self,
@@ -109,23 +196,210 @@ class ConversationContext:
             >>> result = detector.detect("Bonjour!")
             >>> context.add_turn("Bonjour!", result.lang, result.confidence)
         """
-        turn = ConversationTurn(
-            text=text,
-            detected_language=detected_language,
-            confidence=confidence,
-            timestamp=time.time(),
+        timestamp = time.time() if self.use_timestamps else 0.0
+        with self._lock:
+            self._append(text, detected_language, confidence, timestamp)
+
+    def add_turns(self, turns: Iterable[tuple[str, str | None, float]]) -> None:
+        """Add several conversation turns at once.
+
+        Equivalent to calling ``add_turn`` for each ``(text, language,
+        confidence)`` tuple in order, but the lock is taken once and turns
+        that would be evicted before the call returns are skipped. A batch
+        that fills the whole window replaces the history in one pass
+        instead of decaying the running weights once per turn.
+
+        Args:
+            turns: ``(text, detected_language, confidence)`` tuples,
+                oldest first.
+
+        Example:
+            >>> context = ConversationContext(max_turns=3)
+            >>> context.add_turns([("Bonjour!", "fr", 0.9), ("Salut", "fr", 0.8)])
+            >>> context.dominant_language
+            'fr'
+        """
+        turns = list(turns)
+        window = self._window
+        if not window:
+            return
+        timestamp = time.time() if self.use_timestamps else 0.0
+        with self._lock:
+            if len(turns) >= window:
+                self._fill(turns[-window:], timestamp)
+                return
+            for text, detected_language, confidence in turns:
+                self._append(text, detected_language, confidence, timestamp)
+
+    def _fill(self, turns: list[tuple[str, str | None, float]], timestamp: float) -> None:
+        """Replace the whole history with exactly ``_window`` turns, oldest first.
+
+        Callers must hold ``_lock``. Languages are inserted oldest first (so
+        ties in ``_argmax`` break as in ``_append``), then weights are
+        accumulated newest first with a running decay power, giving the same
+        state as appending the turns one at a time to an empty context.
+        """
+        window = self._window
+        texts = self._texts
+        langs = self._langs
+        confs = self._confs
+        timestamps = self._timestamps
+        counts = self._weighted_counts
+        lang_counts = self._lang_counts
+        positive_counts = self._positive_counts
+        counts.clear()
+        lang_counts.clear()
+        positive_counts.clear()
+
+        for slot, (text, lang, confidence) in enumerate(turns):
+            if lang:
+                lang = sys.intern(lang)
+            texts[slot] = text
+            langs[slot] = lang
+            confs[slot] = confidence
+            timestamps[slot] = timestamp
+            if lang and lang != "unknown":
+                counts.setdefault(lang, 0.0)
+                lang_counts[lang] = lang_counts.get(lang, 0) + 1
+                positive_counts[lang] = positive_counts.get(lang, 0) + (confidence > 0)
+
+        decay = self.decay_factor
+        weight = 1.0
+        for slot in range(window - 1, -1, -1):
+            lang = langs[slot]
+            if lang and lang != "unknown":
+                counts[lang] += confs[slot] * weight
+            weight *= decay
+
+        streak_lang = langs[window - 1] or None
+        streak_len = 0
+        if streak_lang:
+            for _, lang, _ in reversed(turns):
+                if lang != streak_lang:
+                    break
+                streak_len += 1
+        self._streak = (streak_lang, streak_len)
+        self._dominant = _argmax(counts)
+
+        self._head = window & self._mask
+        self._count = window
+        self._version += 1
+
+    def _append(
+        self,
+        text: str,
+        detected_language: str | None,
+        confidence: float,
+        timestamp: float,
+    ) -> None:
+        """Append a turn, updating weighted counts incrementally.
+
+        Callers must hold ``_lock`` unless the context is not yet shared.
+
+        Every existing turn ages by one step (weights times decay_factor),
+        the oldest turn is subtracted if the window is full, and
+        the new turn is added at full weight. This costs one multiply per
+        distinct language in the window instead of a rescan of all turns.
+        """
+        window = self._window
+        if not window:
+            return
+        langs = self._langs
+        confs = self._confs
+        mask = self._mask
+        head = self._head
+
+        decay = self.decay_factor
+        counts = self._weighted_counts
+        lang_counts = self._lang_counts
+        positive_counts = self._positive_counts
+
+        if self._count == window:
+            oldest = (head - window) & mask
+            lang = langs[oldest]
+            if lang and lang != "unknown":
+                evicted_conf = confs[oldest]
+                remaining = lang_counts[lang] - 1
+                if not remaining:
+                    del lang_counts[lang]
+                    del positive_counts[lang]
+                    del counts[lang]
+                else:
+                    lang_counts[lang] = remaining
+                    if evicted_conf > 0:
+                        positive_counts[lang] -= 1
+                    if positive_counts[lang]:
+                        weight = evicted_conf * decay ** (window - 1)
+                        counts[lang] = max(counts[lang] - weight, 0.0)
+                    else:
+                        counts[lang] = 0.0
+
+        for key in counts:
+            counts[key] *= decay
+
+        lang = detected_language
+        if lang:
+            # Codes decoded from JSON or a store are fresh string objects;
+            # interning shares one object per code so buffer slots and dict
+            # keys compare by identity
+            lang = sys.intern(lang)
+        if lang and lang != "unknown":
+            counts[lang] = counts.get(lang, 0.0) + confidence
+            lang_counts[lang] = lang_counts.get(lang, 0) + 1
+            positive_counts[lang] = positive_counts.get(lang, 0) + (confidence > 0)
+
+        streak_lang, streak_len = self._streak
+        if not lang:
+            self._streak = (None, 0)
+        elif lang == streak_lang:
+            # The streak can't outgrow the window once old turns are evicted
+            self._streak = (lang, min(streak_len + 1, window))
+        else:
+            self._streak = (lang, 1)
+        self._dominant = _argmax(counts)
+
+        self._texts[head] = text
+        langs[head] = lang
+        confs[head] = confidence
+        self._timestamps[head] = timestamp
+        self._head = (head + 1) & mask
+        if self._count < window:
+            self._count += 1
+        self._version += 1
+
+    def _slots(self) -> range | list[int]:
+        """Slot indices oldest first."""
+        count = self._count
+        capacity = len(self._langs)
+        start = (self._head - count) & self._mask
+        end = start + count
+        if end <= capacity:
+            return range(start, end)
+        return [*range(start, capacity), *range(end - capacity)]
+
+    def _turn_at(self, slot: int) -> ConversationTurn:
+        return ConversationTurn(
+            text=self._texts[slot],
+            detected_language=self._langs[slot],
+            confidence=self._confs[slot],
+            timestamp=self._timestamps[slot],
         )
-        self._turns.append(turn)
+
+    def _ordered(self) -> list[ConversationTurn]:
+        """Turns oldest first (a new list)."""
+        with self._lock:
+            return [self._turn_at(slot) for slot in self._slots()]
 
     @property
     def turns(self) -> list[ConversationTurn]:
         """Get all turns (oldest first, most recent last)."""
-        return list(self._turns)
+        return self._ordered()
 
     @property
     def last_turn(self) -> ConversationTurn | None:
         """Get the most recent turn."""
-        return self._turns[-1] if self._turns else None
+        with self._lock:
+            return self._turn_at((self._head - 1) & self._mask) if self._count else None
 
     @property
     def dominant_language(self) -> str | None:
@@ -133,11 +407,9 @@ class ConversationContext:
         Get the most likely language based on conversation history.
 
         Uses weighted voting where recent turns have higher weight.
+        Lock-free: returns the value published by the latest write.
         """
-        dist = self.language_distribution
-        if not dist:
-            return None
-        return max(dist, key=lambda k: dist[k])
+        return self._dominant
 
     @property
     def language_distribution(self) -> dict[str, float]:
@@ -147,29 +419,24 @@ class ConversationContext:
         Returns:
             Dict mapping language code to weight (sums to 1.0)
         """
-        if not self._turns:
-            return {}
-
-        # Calculate weighted counts
-        weighted_counts: dict[str, float] = {}
-        total_weight = 0.0
-
-        turns_list = list(self._turns)
-        for i, turn in enumerate(turns_list):
-            if turn.detected_language and turn.detected_language != "unknown":
-                # More recent turns get higher weight (exponential decay)
-                recency_weight = self.decay_factor ** (len(turns_list) - 1 - i)
-                weight = recency_weight * turn.confidence
-
-                lang = turn.detected_language
-                if lang not in weighted_counts:
-                    weighted_counts[lang] = 0.0
-                weighted_counts[lang] += weight
-                total_weight += weight
-
-        # Normalize to probabilities
+        return dict(self._distribution())
+
+    def _distribution(self) -> dict[str, float]:
+        """Memoized language distribution (shared, do not mutate)."""
+        cached = self._dist_cache
+        if cached is not None and cached[0] == self._version:
+            return cached[1]
+        with self._lock:
+            version = self._version
+            dist = self._compute_distribution()
+        self._dist_cache = (version, dist)
+        return dist
+
+    def _compute_distribution(self) -> dict[str, float]:
+        # Normalize the running weighted counts to probabilities
+        total_weight = sum(self._weighted_counts.values())
         if total_weight > 0:
-            return {lang: weight / total_weight for lang, weight in weighted_counts.items()}
+            return {lang: weight / total_weight for lang, weight in self._weighted_counts.items()}
         return {}
 
     def get_language_streak(self) -> tuple[str | None, int]:
@@ -179,23 +446,7 @@ class ConversationContext:
         Returns:
             Tuple of (language, streak_count) or (None, 0)
         """
-        if not self._turns:
-            return None, 0
-
-        turns_reversed = list(reversed(self._turns))
-        if not turns_reversed[0].detected_language:
-            return None, 0
-
-        current_lang = turns_reversed[0].detected_language
-        streak = 0
-
-        for turn in turns_reversed:
-            if turn.detected_language == current_lang:
-                streak += 1
-            else:
-                break
-
-        return current_lang, streak
+        return self._streak
 
     def get_context_boost(self, language: str) -> float:
         """
@@ -207,7 +458,17 @@ class ConversationContext:
         Returns:
             Boost value between 0.0 and 0.3
         """
-        dist = self.language_distribution
+        # Called once per candidate language per detection; memoize per version
+        if self._boost_version != self._version:
+            self._boost_cache.clear()
+            self._boost_version = self._version
+        boost = self._boost_cache.get(language)
+        if boost is None:
+            boost = self._boost_cache[language] = self._compute_boost(language)
+        return boost
+
+    def _compute_boost(self, language: str) -> float:
+        dist = self._distribution()
         if language not in dist:
             return 0.0
 
@@ -223,17 +484,76 @@ class ConversationContext:
         return min(base_boost, 0.3)
 
     def clear(self) -> None:
-        """Clear conversation history."""
-        self._turns.clear()
+        """Clear conversation history.
+
+        The ring buffer is reused rather than reallocated, so one context
+        can be cleared and refilled cheaply for many short sessions.
+        """
+        with self._lock:
+            texts = self._texts
+            for slot in self._slots():
+                texts[slot] = ""
+            self._head = 0
+            self._count = 0
+            self._dominant = None
+            self._streak = (None, 0)
+            self._weighted_counts.clear()
+            self._lang_counts.clear()
+            self._positive_counts.clear()
+            self._version += 1
+
+    def __eq__(self, other: object) -> bool:
+        # Settings plus the ordered turns; the ring-buffer columns are laid out
+        # by write position, so they can't be compared field by field
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._to_tuple() == other._to_tuple()  # type: ignore[attr-defined]
 
     def __len__(self) -> int:
-        return len(self._turns)
+        return self._count
 
     def __iter__(self) -> Iterator[ConversationTurn]:
-        return iter(self._turns)
+        return iter(self._ordered())
 
     def __bool__(self) -> bool:
-        return len(self._turns) > 0
+        return self._count > 0
+
+    def _to_tuple(self) -> tuple[int, float, bool, list[tuple[str, str | None, float, float]]]:
+        """Compact ``(max_turns, decay_factor, use_timestamps, turns)`` record.
+
+        Each turn is a ``(text, language, confidence, timestamp)`` tuple,
+        oldest first. This is the fast serialization path; ``to_dict`` wraps
+        it in dictionaries for external consumers.
+        """
+        texts = self._texts
+        langs = self._langs
+        confs = self._confs
+        timestamps = self._timestamps
+        with self._lock:
+            turns = [(texts[s], langs[s], confs[s], timestamps[s]) for s in self._slots()]
+        return (self.max_turns, self.decay_factor, self.use_timestamps, turns)
+
+    @classmethod
+    def _from_tuple(
+        cls, record: tuple[int, float, bool, Iterable[tuple[str, str | None, float, float]]]
+    ) -> ConversationContext:
+        max_turns, decay_factor, use_timestamps, turns = record
+        ctx = cls(max_turns=max_turns, decay_factor=decay_factor, use_timestamps=use_timestamps)
+        for text, detected_language, confidence, timestamp in turns:
+            ctx._append(text, detected_language, confidence, timestamp)
+        return ctx
+
+    def __getstate__(self) -> tuple[int, float, bool, list[tuple[str, str | None, float, float]]]:
+        # The lock and derived caches are rebuilt on unpickling
+        return self._to_tuple()
+
+    def __setstate__(
+        self, state: tuple[int, float, bool, list[tuple[str, str | None, float, float]]]
+    ) -> None:
+        max_turns, decay_factor, use_timestamps, turns = state
+        ConversationContext.__init__(self, max_turns, decay_factor, use_timestamps)
+        for text, detected_language, confidence, timestamp in turns:
+            self._append(text, detected_language, confidence, timestamp)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization.
@@ -248,10 +568,20 @@ class ConversationContext:
             >>> data["turns"][0]["detected_language"]
             'en'
         """
+        max_turns, decay_factor, use_timestamps, turns = self._to_tuple()
         return {
-            "max_turns": self.max_turns,
-            "decay_factor": self.decay_factor,
-            "turns": [turn.to_dict() for turn in self._turns],
+            "max_turns": max_turns,
+            "decay_factor": decay_factor,
+            "use_timestamps": use_timestamps,
+            "turns": [
+                {
+                    "text": text,
+                    "detected_language": lang,
+                    "confidence": conf,
+                    "timestamp": timestamp,
+                }
+                for text, lang, conf, timestamp in turns
+            ],
         }
 
     @classmethod
@@ -270,14 +600,84 @@ class ConversationContext:
             >>> ctx.dominant_language
             'en'
         """
-        ctx = cls(
-            max_turns=data.get("max_turns", 2),
-            decay_factor=data.get("decay_factor", 0.9),
+        return cls._from_tuple(
+            (
+                data.get("max_turns", 2),
+                data.get("decay_factor", 0.9),
+                data.get("use_timestamps", False),
+                (
+                    (
+                        turn["text"],
+                        turn.get("detected_language"),
+                        turn.get("confidence", 0.0),
+                        turn["timestamp"] if "timestamp" in turn else time.time(),
+                    )
+                    for turn in data.get("turns", ())
+                ),
+            )
         )
-        for turn_data in data.get("turns", []):
-            turn = ConversationTurn.from_dict(turn_data)
-            ctx._turns.append(turn)
-        return ctx
+
+    def clone(self) -> ConversationContext:
+        """Create an independent copy of this context.
+
+        Copies the ring buffer and running weights directly, without going
+        through ``to_dict``/``from_dict`` or replaying turns. Use this for
+        same-process handoffs; use ``to_bytes`` to cross process boundaries.
+
+        Returns:
+            A new ConversationContext with the same settings and history.
+
+        Example:
+            >>> fork = context.clone()
+            >>> fork.add_turn("Hola", "es", 0.9)  # context is unaffected
+        """
+        other = object.__new__(type(self))
+        other.max_turns = self.max_turns
+        other.decay_factor = self.decay_factor
+        other.use_timestamps = self.use_timestamps
+        other._lock = threading.Lock()
+        with self._lock:
+            other._texts = self._texts.copy()
+            other._langs = self._langs.copy()
+            other._confs = self._confs[:]
+            other._timestamps = self._timestamps[:]
+            other._window = self._window
+            other._mask = self._mask
+            other._head = self._head
+            other._count = self._count
+            other._version = self._version
+            # The memoized distribution is never mutated, so it can be shared
+            other._dist_cache = self._dist_cache
+            other._boost_cache = self._boost_cache.copy()
+            other._boost_version = self._boost_version
+            other._weighted_counts = self._weighted_counts.copy()
+            other._lang_counts = self._lang_counts.copy()
+            other._positive_counts = self._positive_counts.copy()
+            other._dominant = self._dominant
+            other._streak = self._streak
+        return other
+
+    def __copy__(self) -> ConversationContext:
+        return self.clone()
+
+    def to_bytes(self) -> bytes:
+        """Serialize to compact JSON bytes.
+
+        Turns are encoded as ``[text, language, confidence, timestamp]``
+        arrays rather than objects, so no key strings go over the wire.
+        Uses orjson when it is installed.
+
+        Example:
+            >>> data = context.to_bytes()
+            >>> ConversationContext.from_bytes(data).dominant_language
+            'en'
+        """
+        return dumps(self._to_tuple())
+
+    @classmethod
+    def from_bytes(cls, data: bytes | str) -> ConversationContext:
+        """Create from bytes produced by ``to_bytes``."""
+        return cls._from_tuple(loads(data))
 
     @classmethod
     def from_history(
@@ -293,7 +693,8 @@ class ConversationContext:
         eliminating server-side state and race conditions.
 
         Args:
-            history: List of (lang, confidence) tuples or dicts with 'lang'/'confidence'.
+            history: List of (lang, confidence) pairs (tuples, or lists as decoded
+                from JSON) or dicts with 'lang'/'confidence'.
                 Only language and confidence are needed, not the original text.
             max_turns: Maximum turns to consider. Default: 5.
             decay_factor: Recency weight decay. Default: 0.9.
@@ -320,14 +721,70 @@ class ConversationContext:
             1. Store recent detection results (last 3-5)
             2. Pass them with each request
             3. Append new result to their history after detection
+
+            Contexts built from tuple histories are memoized (clients resend
+            the same history on retries and across requests); each call
+            still returns a fresh copy that is safe to mutate.
         """
+        # Materialize once: the cache key and the fallback build must see the
+        # same items even when history is a one-shot iterator
+        history = tuple(history)
+        if cls is ConversationContext:
+            try:
+                cached = _history_context(history, max_turns, decay_factor)
+            except TypeError:
+                # Dict (or JSON list) items aren't hashable; build directly
+                pass
+            else:
+                return cached.clone()
+        return cls._build_from_history(history, max_turns, decay_factor)
+
+    @classmethod
+    def _from_pairs(
+        cls, history: tuple[tuple[str, float], ...], max_turns: int, decay_factor: float
+    ) -> ConversationContext:
+        """from_history for the hot all-tuples shape: no per-item type checks."""
         ctx = cls(max_turns=max_turns, decay_factor=decay_factor)
+        ctx.add_turns([("", lang, conf) for lang, conf in history if lang])
+        return ctx
+
+    @classmethod
+    def _build_from_history(
+        cls,
+        history: Iterable[tuple[str, float] | list[Any] | dict[str, Any]],
+        max_turns: int,
+        decay_factor: float,
+    ) -> ConversationContext:
+        ctx = cls(max_turns=max_turns, decay_factor=decay_factor)
+        turns: list[tuple[str, str | None, float]] = []
         for item in history:
-            if isinstance(item, tuple):
+            if isinstance(item, (tuple, list)):
                 lang, conf = item
             else:
                 lang = item.get("lang") or item.get("detected_language", "")
                 conf = item.get("confidence", 1.0)
             if lang:
-                ctx.add_turn("", lang, conf)
+                turns.append(("", lang, conf))
+        ctx.add_turns(turns)
         return ctx
+
+
+def _argmax(counts: dict[str, float]) -> str | None:
+    """Language with the highest positive weight, or None."""
+    if not counts:
+        return None
+    lang = max(counts, key=counts.__getitem__)
+    # Normalizing doesn't change the argmax, so no distribution is needed
+    return lang if counts[lang] > 0 else None
+
+
+@lru_cache(maxsize=4096)
+def _history_context(
+    history: tuple[tuple[str, float], ...], max_turns: int, decay_factor: float
+) -> ConversationContext:
+    """Memoized from_history template; callers must clone before handing out.
+
+    The history hashed, so it holds no dicts or JSON lists and every item
+    can be unpacked as a (lang, confidence) pair.
+    """
+    return ConversationContext._from_pairs(history, max_turns, decay_factor)
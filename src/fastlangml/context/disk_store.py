@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+import threading
 from collections.abc import Iterator
 from contextlib import contextmanager
 from typing import Any
 
 from fastlangml.context.conversation import ConversationContext
 
+# Number of lock stripes guarding session() read-modify-write cycles
+_LOCK_STRIPES = 16
+
 
 class DiskContextStore:
     """Disk-based context storage using diskcache.
@@ -16,6 +20,11 @@ class DiskContextStore:
 
     Stores only essential data (lang, confidence) for efficiency.
 
+    ``session()`` holds a per-session lock (striped by session id) for the
+    whole load-modify-save cycle, so threads in one process sharing a store
+    don't overwrite each other's turns. Distinct sessions rarely share a
+    stripe and proceed in parallel.
+
     Args:
         directory: Path to cache directory.
         ttl_seconds: Time-to-live in seconds. None = no expiration.
@@ -38,6 +47,10 @@ class DiskContextStore:
         self._cache: Any = Cache(directory)
         self._ttl = ttl_seconds
         self._max_turns = max_turns
+        self._locks = [threading.RLock() for _ in range(_LOCK_STRIPES)]
+
+    def _lock_for(self, session_id: str) -> threading.RLock:
+        return self._locks[hash(session_id) % _LOCK_STRIPES]
 
     def save(self, session_id: str, context: ConversationContext) -> None:
         """Save context (stores only lang/confidence)."""
@@ -64,8 +77,9 @@ class DiskContextStore:
     @contextmanager
     def session(self, session_id: str) -> Iterator[ConversationContext]:
         """Context manager that auto-saves on exit."""
-        ctx = self.load(session_id) or ConversationContext(max_turns=self._max_turns)
-        try:
-            yield ctx
-        finally:
-            self.save(session_id, ctx)
+        with self._lock_for(session_id):
+            ctx = self.load(session_id) or ConversationContext(max_turns=self._max_turns)
+            try:
+                yield ctx
+            finally:
+                self.save(session_id, ctx)
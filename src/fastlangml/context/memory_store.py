@@ -0,0 +1,102 @@
+"""In-process context storage."""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from fastlangml.context.conversation import ConversationContext
+
+
+class _StoreShard:
+    """One independently locked segment of a MemoryContextStore."""
+
+    __slots__ = ("contexts", "lock")
+
+    def __init__(self) -> None:
+        self.contexts: dict[str, ConversationContext] = {}
+        # Reentrant so a session() body can still call load/save/exists
+        self.lock = threading.RLock()
+
+
+class MemoryContextStore:
+    """In-process context storage for single-process servers and tests.
+
+    No extra dependencies. Sessions are spread over independently locked
+    shards by session id hash, so threads working on different sessions
+    rarely contend on the same lock. ``session()`` holds the shard lock for
+    its whole load-modify-save cycle, so concurrent updates to one session
+    are never lost.
+
+    Args:
+        max_turns: Turns kept for newly created sessions. Default: 5.
+        num_shards: Number of shards (power of two). Default: 16.
+
+    Example:
+        >>> store = MemoryContextStore()
+        >>> with store.session(session_id) as ctx:
+        ...     result = detect(text, context=ctx, auto_update=True)
+    """
+
+    def __init__(self, max_turns: int = 5, num_shards: int = 16) -> None:
+        if num_shards < 1 or num_shards & (num_shards - 1):
+            raise ValueError(f"num_shards must be a power of two, got {num_shards}")
+        self._max_turns = max_turns
+        self._mask = num_shards - 1
+        self._shards = [_StoreShard() for _ in range(num_shards)]
+
+    def _shard(self, session_id: str) -> _StoreShard:
+        return self._shards[hash(session_id) & self._mask]
+
+    def save(self, session_id: str, context: ConversationContext) -> None:
+        """Save a copy of context (later changes to context aren't stored)."""
+        shard = self._shard(session_id)
+        snapshot = context.clone()
+        with shard.lock:
+            shard.contexts[session_id] = snapshot
+
+    def load(self, session_id: str) -> ConversationContext | None:
+        """Load a copy of the context. Returns None if not found."""
+        shard = self._shard(session_id)
+        with shard.lock:
+            ctx = shard.contexts.get(session_id)
+            return ctx.clone() if ctx is not None else None
+
+    def delete(self, session_id: str) -> bool:
+        """Delete context."""
+        shard = self._shard(session_id)
+        with shard.lock:
+            return shard.contexts.pop(session_id, None) is not None
+
+    def exists(self, session_id: str) -> bool:
+        """Check if session exists."""
+        shard = self._shard(session_id)
+        with shard.lock:
+            return session_id in shard.contexts
+
+    def __len__(self) -> int:
+        total = 0
+        for shard in self._shards:
+            with shard.lock:
+                total += len(shard.contexts)
+        return total
+
+    @contextmanager
+    def session(self, session_id: str) -> Iterator[ConversationContext]:
+        """Context manager that auto-saves on exit.
+
+        Yields a copy, like load(); it is stored back when the block exits,
+        so references kept after the block don't change the stored session.
+        """
+        shard = self._shard(session_id)
+        with shard.lock:
+            stored = shard.contexts.get(session_id)
+            if stored is None:
+                ctx = ConversationContext(max_turns=self._max_turns)
+            else:
+                ctx = stored.clone()
+            try:
+                yield ctx
+            finally:
+                shard.contexts[session_id] = ctx.clone()
@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
-import json
 from collections.abc import Iterator
 from contextlib import contextmanager
 from typing import Any
 
 from fastlangml.context.conversation import ConversationContext
+from fastlangml.context.serialization import dumps, loads
 
 
 class RedisContextStore:
@@ -51,7 +51,7 @@ class RedisContextStore:
         history = [
             (t.detected_language, t.confidence) for t in context.turns if t.detected_language
         ][-self._max_turns :]
-        data = json.dumps(history)
+        data = dumps(history)
         if self._ttl:
             self._client.setex(self._key(session_id), self._ttl, data)
         else:
@@ -62,7 +62,7 @@ class RedisContextStore:
         data = self._client.get(self._key(session_id))
         if data is None:
             return None
-        history = json.loads(data)
+        history = loads(data)
         return ConversationContext.from_history(history, max_turns=self._max_turns)
 
     def delete(self, session_id: str) -> bool:
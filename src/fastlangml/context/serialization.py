@@ -0,0 +1,31 @@
+"""JSON helpers shared by the context stores.
+
+Uses orjson when it is installed (pip install fastlangml[orjson]) and falls
+back to the standard library json module otherwise.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def dumps(obj: Any) -> bytes:
+    """Encode obj as compact JSON bytes (orjson when installed)."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def loads(data: bytes | str) -> Any:
+    """Decode JSON produced by ``dumps``."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -16,7 +16,7 @@ from __future__ import annotations
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
-from typing import Literal
+from typing import Any, Literal
 
 from fastlangml.backends import (
     Backend,
@@ -27,7 +27,7 @@ from fastlangml.backends import (
 from fastlangml.backends import (
     DetectionResult as BackendResult,
 )
-from fastlangml.cache import get_cache
+from fastlangml.cache import get_detection_cache
 from fastlangml.context.conversation import ConversationContext
 from fastlangml.ensemble.voting import (
     TieBreaker,
@@ -71,6 +71,25 @@ _UNAMBIGUOUS_SCRIPTS: dict[str, str] = {
 }
 
 
+def _votes_by_language(
+    backend_results: list[BackendResult], ndigits: int | None = None
+) -> dict[str, dict[str, float]]:
+    """Index backend confidences by voted language in one pass.
+
+    Returns {language: {backend_name: confidence}}, with confidences rounded
+    to ndigits if given.
+    """
+    votes: dict[str, dict[str, float]] = {}
+    for r in backend_results:
+        confidence = r.confidence if ndigits is None else round(r.confidence, ndigits)
+        lang_votes = votes.get(r.language)
+        if lang_votes is None:
+            votes[r.language] = {r.backend_name: confidence}
+        else:
+            lang_votes[r.backend_name] = confidence
+    return votes
+
+
 @dataclass
 class DetectionConfig:
     """Configuration for language detection."""
@@ -138,6 +157,9 @@ class DetectionConfig:
     cache_size: int = 1000
     """LRU cache size for repeated strings."""
 
+    cache_max_chars: int = 256
+    """Texts longer than this bypass the cache (repeats are rare, keys are large)."""
+
     # Context and hints
     context_weight: float = 0.2
     """How much conversation context influences detection."""
@@ -189,10 +211,13 @@ class FastLangDetector:
         self._proper_noun_filter = ProperNounFilter(strategy=self._config.proper_noun_strategy)
         self._script_filter = ScriptFilter()
         self._voting = self._create_voting_strategy()
-        self._cache = get_cache(self._config.cache_size)
+        self._cache = get_detection_cache(self._config.cache_size)
 
         # Persistent thread pool for parallel backend calls (lazy init)
         self._executor: ThreadPoolExecutor | None = None
+        # Separate pool for detect_batch: its workers wait on backend calls
+        # submitted to _executor, so sharing one pool can deadlock
+        self._batch_executor: ThreadPoolExecutor | None = None
 
     @classmethod
     def default(cls) -> FastLangDetector:
@@ -323,15 +348,19 @@ class FastLangDetector:
 
         # Check cache (include allowed_langs for correctness)
         # P1 Optimization: Use tuple key instead of string concatenation (faster hashing)
-        cache_key = (
-            text,
-            effective_mode,
-            top_k,
-            tuple(sorted(effective_langs_set)) if effective_langs_set else (),
-        )
-        cached = self._cache.get(cache_key)
-        if cached is not None:
-            return cached
+        # Long texts skip the cache: they rarely repeat, and caching them would
+        # hash and retain kilobyte-sized keys.
+        cache_key: tuple[Any, ...] | None = None
+        if len(text) <= self._config.cache_max_chars:
+            cache_key = (
+                text,
+                effective_mode,
+                top_k,
+                tuple(sorted(effective_langs_set)) if effective_langs_set else (),
+            )
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return cached
 
         # Normalize text
         processed = text
@@ -431,7 +460,8 @@ class FastLangDetector:
                         "short_circuit": True,
                     },
                 )
-                self._cache[cache_key] = result
+                if cache_key is not None:
+                    self._cache.put(cache_key, result)
                 self._update_context_if_needed(text, result, context, auto_update)
                 return result
 
@@ -557,12 +587,7 @@ class FastLangDetector:
             diff = sorted_results[0][1] - sorted_results[1][1]
             threshold = self._config.thresholds.get(effective_mode, 0.5)
             if diff < 0.1 and sorted_results[0][1] < threshold:
-
-                def _get_votes(lang: str) -> dict[str, float]:
-                    return {
-                        r.backend_name: r.confidence for r in backend_results if r.language == lang
-                    }
-
+                votes = _votes_by_language(backend_results)
                 result = DetectionResult(
                     lang="und",
                     confidence=sorted_results[0][1],
@@ -574,7 +599,7 @@ class FastLangDetector:
                         Candidate(
                             lang=normalize_lang_tag(lang),
                             confidence=score,
-                            backend_votes=_get_votes(lang),
+                            backend_votes=votes.get(lang) or {},
                         )
                         for lang, score in sorted_results[:top_k]
                     ],
@@ -585,7 +610,8 @@ class FastLangDetector:
                         ],
                     },
                 )
-                self._cache[cache_key] = result
+                if cache_key is not None:
+                    self._cache.put(cache_key, result)
                 self._update_context_if_needed(text, result, context, auto_update)
                 return result
 
@@ -630,26 +656,23 @@ class FastLangDetector:
                     ],
                 },
             )
-            self._cache[cache_key] = result
+            if cache_key is not None:
+                self._cache.put(cache_key, result)
             self._update_context_if_needed(text, result, context, auto_update)
             return result
 
-        # Build successful result
-        def _votes_for(lang: str) -> dict[str, float]:
-            return {
-                r.backend_name: round(r.confidence, 4)
-                for r in backend_results
-                if r.language == lang
-            }
-
-        candidates = [
-            Candidate(
-                lang=normalize_lang_tag(lang),
-                confidence=round(score, 4),
-                backend_votes=_votes_for(lang),
-            )
-            for lang, score in sorted_results[:top_k]
-        ]
+        # Build successful result (candidates are only reported for top_k > 1)
+        candidates: list[Candidate] = []
+        if top_k > 1:
+            votes = _votes_by_language(backend_results, ndigits=4)
+            candidates = [
+                Candidate(
+                    lang=normalize_lang_tag(lang),
+                    confidence=round(score, 4),
+                    backend_votes=votes.get(lang) or {},
+                )
+                for lang, score in sorted_results[:top_k]
+            ]
 
         result = DetectionResult(
             lang=normalize_lang_tag(top_lang),
@@ -657,7 +680,7 @@ class FastLangDetector:
             reliable=top_score >= threshold,
             script=detected_script,
             backend=backend_name,
-            candidates=candidates if top_k > 1 else [],
+            candidates=candidates,
             meta={
                 "elapsed_ms": round((time.perf_counter() - start_time) * 1000, 2),
                 "backend_results": [
@@ -666,7 +689,8 @@ class FastLangDetector:
             },
         )
 
-        self._cache[cache_key] = result
+        if cache_key is not None:
+            self._cache.put(cache_key, result)
         self._update_context_if_needed(text, result, context, auto_update)
         return result
 
@@ -707,12 +731,12 @@ class FastLangDetector:
 
         results: list[DetectionResult | None] = [None] * len(texts)
 
-        # Reuse detector's executor or create one for batch
-        if self._executor is None:
-            self._executor = ThreadPoolExecutor(max_workers=max(len(self._backends), 4))
+        # Reuse detector's batch executor or create one
+        if self._batch_executor is None:
+            self._batch_executor = ThreadPoolExecutor(max_workers=max(len(self._backends), 4))
 
         futures = {
-            self._executor.submit(detect_single, (i, text)): i for i, text in enumerate(texts)
+            self._batch_executor.submit(detect_single, (i, text)): i for i, text in enumerate(texts)
         }
         for future in as_completed(futures):
             idx, result = future.result()
@@ -750,8 +774,8 @@ class FastLangDetector:
 
     @property
     def cache_stats(self) -> dict[str, int]:
-        """Get cache statistics."""
-        return {"size": len(self._cache), "maxsize": self._cache.maxsize}
+        """Get cache statistics (size, maxsize, hits, misses)."""
+        return self._cache.stats()
 
 
 class FastLangDetectorBuilder:
@@ -10,6 +10,8 @@ from dataclasses import dataclass, field
 
 # Language pairs that are commonly confused by detectors
 # Format: (lang1, lang2): discriminating_features
+# Read-only reference data: ConfusionResolver indexes the features once
+# at import, so entries added or changed at runtime are not picked up.
 CONFUSED_PAIRS: dict[frozenset[str], dict[str, list[str]]] = {
     # Spanish vs Portuguese
     frozenset({"es", "pt"}): {
@@ -432,6 +434,26 @@ CONFUSED_PAIRS: dict[frozenset[str], dict[str, list[str]]] = {
 }
 
 
+def _feature_index(
+    features_by_lang: dict[str, list[str]],
+) -> tuple[tuple[str, tuple[str, ...]], ...]:
+    """Map each distinct feature of a confused pair to the languages listing it.
+
+    Many features are shared across a pair's languages (e.g. "porque" for
+    both es and pt), so each substring is tested against the text once and
+    the hit credited to every language that lists it (once per listing).
+    """
+    index: dict[str, list[str]] = {}
+    for lang, features in features_by_lang.items():
+        for feature in features:
+            index.setdefault(feature, []).append(lang)
+    return tuple((feature, tuple(langs)) for feature, langs in index.items())
+
+
+# Built once from the read-only CONFUSED_PAIRS table
+_FEATURE_INDEX = {pair: _feature_index(features) for pair, features in CONFUSED_PAIRS.items()}
+
+
 @dataclass
 class ConfusionResolver:
     """Resolves ambiguity between commonly confused language pairs.
@@ -496,13 +518,11 @@ class ConfusionResolver:
         text_lower = text.lower()
         feature_scores: dict[str, float] = {lang: 0.0 for lang in confused_pair}
 
-        pair_features = CONFUSED_PAIRS.get(confused_pair, {})
-        for lang, features in pair_features.items():
-            if lang not in scores:
-                continue
-            for feature in features:
-                if feature in text_lower:
-                    feature_scores[lang] += 1
+        for feature, langs in _FEATURE_INDEX.get(confused_pair, ()):
+            if feature in text_lower:
+                for lang in langs:
+                    if lang in scores:
+                        feature_scores[lang] += 1
 
         # Normalize and apply boost
         total_features = sum(feature_scores.values())
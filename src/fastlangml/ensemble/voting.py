@@ -50,49 +50,54 @@ class TieBreaker:
         if not results:
             return {}
 
-        # Group results by language
-        lang_results: dict[str, list[DetectionResult]] = {}
+        # One pass over the results, accumulating per-language
+        # [agreeing backends, confidence sum, reliable count, max backend reliability]
+        stats: dict[str, list[float]] = {}
+        reliability = BACKEND_RELIABILITY.get
         for r in results:
-            if r.language != "unknown":
-                if r.language not in lang_results:
-                    lang_results[r.language] = []
-                lang_results[r.language].append(r)
-
-        if not lang_results:
+            lang = r.language
+            if lang == "unknown":
+                continue
+            rel = reliability(r.backend_name, 0)
+            entry = stats.get(lang)
+            if entry is None:
+                stats[lang] = [1, r.confidence, 1 if r.is_reliable else 0, rel]
+            else:
+                entry[0] += 1
+                entry[1] += r.confidence
+                if r.is_reliable:
+                    entry[2] += 1
+                if rel > entry[3]:
+                    entry[3] = rel
+
+        if not stats:
             return {}
 
         # Calculate scores for each language
         scores: dict[str, float] = {}
+        n_results = len(results)
+        script_languages = self.script_languages
+        allowed_languages = self.allowed_languages
 
-        for lang, lang_res in lang_results.items():
-            score = 0.0
-
+        for lang, (count, confidence_sum, reliable_count, max_backend_reliability) in stats.items():
             # Factor 1: Number of backends agreeing
-            agreement_score = len(lang_res) / len(results)
-            score += agreement_score * 0.3
+            score = count / n_results * 0.3
 
             # Factor 2: Average confidence
-            avg_confidence = sum(r.confidence for r in lang_res) / len(lang_res)
-            score += avg_confidence * 0.25
+            score += confidence_sum / count * 0.25
 
             # Factor 3: Reliability flags
-            reliable_count = sum(1 for r in lang_res if r.is_reliable)
-            reliability_score = reliable_count / len(lang_res)
-            score += reliability_score * 0.2
+            score += reliable_count / count * 0.2
 
             # Factor 4: Backend reliability ranking
-            max_backend_reliability = max(
-                BACKEND_RELIABILITY.get(r.backend_name, 0) for r in lang_res
-            )
-            backend_score = max_backend_reliability / 5.0  # Normalize to 0-1
-            score += backend_score * 0.15
+            score += max_backend_reliability / 5.0 * 0.15  # Normalize to 0-1
 
             # Factor 5: Script match bonus
-            if self.script_languages and lang in self.script_languages:
+            if script_languages and lang in script_languages:
                 score += 0.05
 
             # Factor 6: Allowed languages filter
-            if self.allowed_languages and lang not in self.allowed_languages:
+            if allowed_languages and lang not in allowed_languages:
                 score *= 0.1  # Heavy penalty for non-allowed
 
             scores[lang] = min(score, 1.0)  # Cap at 1.0
@@ -140,31 +145,24 @@ class HardVoting(VotingStrategy):
             return {}
 
         # Count votes (only from reliable results if possible)
-        reliable_results = [r for r in results if r.is_reliable]
-        voting_results = reliable_results if reliable_results else results
-
-        # If weights provided, use weighted voting instead of simple count
-        if weights:
-            weighted_votes: dict[str, float] = {}
-            total_weight = 0.0
-            for r in voting_results:
-                if r.language != "unknown":
-                    w = weights.get(r.backend_name, 1.0)
-                    weighted_votes[r.language] = weighted_votes.get(r.language, 0.0) + w
-                    total_weight += w
-            if total_weight > 0:
-                return {lang: score / total_weight for lang, score in weighted_votes.items()}
+        voting_results = [r for r in results if r.is_reliable] or results
+
+        # One pass: tally votes (weighted if weights provided) and their total
+        votes: dict[str, float] = {}
+        get = votes.get
+        total = 0.0
+        for r in voting_results:
+            lang = r.language
+            if lang != "unknown":
+                w = weights.get(r.backend_name, 1.0) if weights else 1.0
+                votes[lang] = get(lang, 0.0) + w
+                total += w
+
+        if total <= 0:
             return {}
 
-        votes = Counter(r.language for r in voting_results if r.language != "unknown")
-
-        if not votes:
-            return {}
-
-        total_votes = sum(votes.values())
-
         # Convert to probabilities
-        return {lang: count / total_votes for lang, count in votes.items()}
+        return {lang: score / total for lang, score in votes.items()}
 
 
 class SoftVoting(VotingStrategy):
@@ -183,35 +181,29 @@ class SoftVoting(VotingStrategy):
         if not results:
             return {}
 
-        # If weights provided, use weighted average
+        # Sum probabilities per language in one pass: scaled by normalized
+        # backend weight if weights provided, else averaged afterwards
+        # (filling in 0 for backends that didn't report)
+        totals: dict[str, float] = {}
+        get = totals.get
+
         if weights:
-            weighted_probs: dict[str, float] = {}
-            total_weight = sum(weights.get(r.backend_name, 1.0) for r in results)
-            if total_weight == 0:
-                total_weight = 1.0
+            backend_weights = [weights.get(r.backend_name, 1.0) for r in results]
+            total_weight = sum(backend_weights) or 1.0
 
-            for result in results:
-                w = weights.get(result.backend_name, 1.0) / total_weight
+            for result, w in zip(results, backend_weights, strict=True):
+                scale = w / total_weight
                 for lang, prob in result.all_probabilities.items():
-                    weighted_probs[lang] = weighted_probs.get(lang, 0.0) + prob * w
+                    totals[lang] = get(lang, 0.0) + prob * scale
 
-            return weighted_probs
-
-        # Aggregate all probabilities
-        all_langs: dict[str, list[float]] = {}
+            return totals
 
         for result in results:
             for lang, prob in result.all_probabilities.items():
-                if lang not in all_langs:
-                    all_langs[lang] = []
-                all_langs[lang].append(prob)
-
-        # Average probabilities (filling in 0 for backends that didn't report)
-        averaged = {}
-        for lang, probs in all_langs.items():
-            averaged[lang] = sum(probs) / len(results)
+                totals[lang] = get(lang, 0.0) + prob
 
-        return averaged
+        n = len(results)
+        return {lang: total / n for lang, total in totals.items()}
 
 
 @dataclass
@@ -242,44 +234,44 @@ class WeightedVoting(VotingStrategy):
 
         # Use provided weights, fall back to default_weights, then reliability
         effective_weights = weights or self.default_weights
+        use_reliability = self.use_reliability_weights
+        square = self.square_reliability
+        reliability = BACKEND_RELIABILITY.get
 
-        # Determine weights for each backend
-        backend_weights = {}
-        for result in results:
-            if result.backend_name in effective_weights:
-                backend_weights[result.backend_name] = effective_weights[result.backend_name]
-            elif self.use_reliability_weights:
-                # Use reliability ranking as default weight
-                rel = BACKEND_RELIABILITY.get(result.backend_name, 1.0)
-                # Square reliability to favor high-reliability backends more
-                # This prevents overconfident low-reliability backends from dominating
-                backend_weights[result.backend_name] = rel * rel if self.square_reliability else rel
-            else:
-                backend_weights[result.backend_name] = 1.0
-
-        # Normalize weights
-        total_weight = sum(backend_weights.values())
-        if total_weight == 0:
-            total_weight = 1.0
-        normalized_weights = {k: v / total_weight for k, v in backend_weights.items()}
-
-        # Aggregate weighted votes
-        # Use primary prediction from each backend (more reliable than all_probabilities
-        # since backends have different output formats)
+        # One pass: resolve each backend's weight on first sight and add its
+        # weighted vote; normalizing by the total weight is deferred to the end
+        backend_weights: dict[str, float] = {}
         weighted_probs: dict[str, float] = {}
+        get = weighted_probs.get
 
         for result in results:
-            weight = normalized_weights[result.backend_name]
+            name = result.backend_name
+            weight = backend_weights.get(name)
+            if weight is None:
+                if name in effective_weights:
+                    weight = effective_weights[name]
+                elif use_reliability:
+                    # Use reliability ranking as default weight
+                    rel = reliability(name, 1.0)
+                    # Square reliability to favor high-reliability backends more
+                    # This prevents overconfident low-reliability backends from dominating
+                    weight = rel * rel if square else rel
+                else:
+                    weight = 1.0
+                backend_weights[name] = weight
+
+            # Use primary prediction from each backend (more reliable than
+            # all_probabilities since backends have different output formats)
             lang = result.language
-
             if lang and lang != "unknown":
                 # Weight = reliability² × confidence
                 # This ensures high-reliability backends with reasonable confidence
                 # beat low-reliability backends with overconfident wrong answers
-                contribution = weight * result.confidence
-                weighted_probs[lang] = weighted_probs.get(lang, 0.0) + contribution
+                weighted_probs[lang] = get(lang, 0.0) + weight * result.confidence
 
-        return weighted_probs
+        # Normalize weights
+        total_weight = sum(backend_weights.values()) or 1.0
+        return {lang: score / total_weight for lang, score in weighted_probs.items()}
 
 
 @dataclass
@@ -305,18 +297,18 @@ class ConsensusVoting(VotingStrategy):
         if not results:
             return {}
 
-        # Count top-1 predictions
+        # Count top-1 predictions once; both branches below reuse the counts
         top_predictions = Counter(r.language for r in results if r.language != "unknown")
 
-        # Filter to languages meeting agreement threshold
-        agreed = {
-            lang: count / len(results)
-            for lang, count in top_predictions.items()
-            if count >= self.min_agreement
-        }
-
-        if agreed:
-            return agreed
+        # Filter to languages meeting agreement threshold (none can if even
+        # the most common language falls short)
+        if top_predictions and max(top_predictions.values()) >= self.min_agreement:
+            n = len(results)
+            return {
+                lang: count / n
+                for lang, count in top_predictions.items()
+                if count >= self.min_agreement
+            }
 
         # Fallback if no consensus (pass weights through)
         fallback = self.fallback_strategy or SoftVoting()
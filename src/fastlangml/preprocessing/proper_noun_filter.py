@@ -8,11 +8,243 @@ actual content language.
 from __future__ import annotations
 
 import re
-from typing import TYPE_CHECKING, Literal
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Literal
 
 if TYPE_CHECKING:
     import spacy
 
+# Characters stripped from a word before the common-word lookup
+_NON_WORD_RE = re.compile(r"[^\w]")
+
+# Split on common sentence endings
+_SENT_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+
+# Token endings that make the next token a sentence start
+_SENTENCE_END = (".", "!", "?")
+
+# Texts per nlp.pipe batch in filter_batch
+_SPACY_BATCH_SIZE = 64
+
+# Pipeline components NER doesn't need (tok2vec and ner stay enabled).
+# Sentence boundaries come from _SENT_SPLIT_RE, never from senter/parser.
+_SPACY_UNUSED_PIPES = ("tagger", "parser", "senter", "lemmatizer", "attribute_ruler")
+
+# ASCII digits, for a C-level "contains a number" check via isdisjoint
+_DIGIT_SET = frozenset("0123456789")
+
+# A token starting with an ASCII capital (other than the first token)
+_SPACED_CAPITAL_RE = re.compile(r"\s[A-Z]")
+
+# Pattern for potential proper nouns (capitalized words not at sentence start)
+_PROPER_NOUN_RE = re.compile(r"\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b")
+
+# Common title words to preserve (not proper nouns)
+_COMMON_WORDS = frozenset(
+    {
+        # English
+        "the",
+        "a",
+        "an",
+        "in",
+        "on",
+        "at",
+        "to",
+        "for",
+        "of",
+        "with",
+        "is",
+        "are",
+        "was",
+        "were",
+        "be",
+        "been",
+        "being",
+        "have",
+        "has",
+        "had",
+        "do",
+        "does",
+        "did",
+        "will",
+        "would",
+        "could",
+        "should",
+        "may",
+        "might",
+        "must",
+        "shall",
+        "can",
+        "need",
+        "dare",
+        "ought",
+        "used",
+        "i",
+        "you",
+        "he",
+        "she",
+        "it",
+        "we",
+        "they",
+        "what",
+        "which",
+        "who",
+        "whom",
+        "this",
+        "that",
+        "these",
+        "those",
+        "am",
+        "and",
+        "or",
+        "but",
+        "if",
+        "then",
+        "else",
+        "when",
+        "where",
+        "why",
+        "how",
+        "all",
+        "each",
+        "every",
+        "both",
+        "few",
+        "more",
+        "most",
+        "other",
+        "some",
+        "such",
+        "no",
+        "nor",
+        "not",
+        "only",
+        "own",
+        "same",
+        "so",
+        "than",
+        "too",
+        "very",
+        "just",
+        "also",
+        "now",
+        "here",
+        "there",
+        # Common words in other languages that might appear capitalized
+        "der",
+        "die",
+        "das",
+        "und",
+        "oder",  # German
+        "le",
+        "la",
+        "les",
+        "et",
+        "ou",  # French
+        "el",
+        "los",
+        "las",
+        "y",
+        "o",  # Spanish
+        "il",
+        "lo",
+        "gli",
+        "e",  # Italian
+    }
+)
+
+
+def _split_sentences(text: str) -> list[str]:
+    """Simple sentence splitting."""
+    sentences = _SENT_SPLIT_RE.split(text)
+    return [s.strip() for s in sentences if s.strip()]
+
+
+def _has_mid_sentence_capital(text: str) -> bool:
+    """Check whether ASCII text has a capitalized token not starting a sentence.
+
+    Only such tokens can be dropped by the heuristic filter. The regex scan
+    runs in C; the sentence-start check is made only at its (few) matches.
+    """
+    for match in _SPACED_CAPITAL_RE.finditer(text):
+        # Walk back over whitespace instead of slicing, so each check is O(gap)
+        i = match.start() - 1
+        while i >= 0 and text[i].isspace():
+            i -= 1
+        if i >= 0 and text[i] not in _SENTENCE_END:
+            return True
+    return False
+
+
+def _apply_heuristics(text: str, strategy: str) -> str:
+    """Heuristic proper noun filter.
+
+    Single pass over whitespace tokens: a token ending in . ! or ? marks the
+    next token as a sentence start, matching the sentence split used by
+    identify_proper_nouns without materializing the sentences.
+    """
+    filtered_words: list[str] = []
+    # Bind hot lookups to locals; this loop runs once per token
+    append = filtered_words.append
+    strip_non_word = _NON_WORD_RE.sub
+    common_words = _COMMON_WORDS
+    has_no_digits = _DIGIT_SET.isdisjoint
+    mask = strategy == "mask"
+    at_sentence_start = True
+
+    for word in text.split():
+        # Keep word if:
+        # - It's lowercase
+        # - It's first word of sentence (capitalization expected)
+        # - It's a common word
+        # - It contains numbers
+        # - It's an acronym/all caps (might be important)
+        # Checks short-circuit, cheapest first.
+        if (
+            at_sentence_start
+            or not word[0].isupper()
+            # (str.isalpha skips the regex for the common, already-clean word)
+            or (word.lower() if word.isalpha() else strip_non_word("", word).lower())
+            in common_words
+            or not has_no_digits(word)
+            or (word.isupper() and len(word) > 1)
+        ):
+            append(word)
+        elif mask:
+            append("[NAME]")
+        # else: remove (don't append)
+
+        at_sentence_start = word.endswith(_SENTENCE_END)
+
+    return " ".join(filtered_words)
+
+
+# Memoized for short texts only (chat strings repeat heavily); longer texts
+# bypass it so whole documents aren't kept alive (same bound as
+# DetectionConfig.cache_max_chars)
+_MEMO_MAX_CHARS = 256
+
+_filter_heuristics = lru_cache(maxsize=4096)(_apply_heuristics)
+
+
+@lru_cache(maxsize=4)
+def _load_spacy_model(model_name: str) -> spacy.Language | None:
+    """Load a spaCy model for NER, shared by every filter that uses it."""
+    try:
+        import spacy
+
+        nlp = spacy.load(model_name)
+    except (ImportError, OSError):
+        # spaCy not installed or model not found
+        return None
+
+    # Only doc.ents is read; skip the tagger/parser forward passes. Checked
+    # against pipe_names so models without some of these still load.
+    for name in _SPACY_UNUSED_PIPES:
+        if name in nlp.pipe_names:
+            nlp.disable_pipe(name)
+    return nlp
+
 
 class ProperNounFilter:
     """
@@ -32,6 +264,7 @@ class ProperNounFilter:
         use_spacy: bool = False,
         spacy_model: str = "en_core_web_sm",
         entity_types: set[str] | None = None,
+        prefer_gpu: bool = False,
     ) -> None:
         """
         Args:
@@ -42,145 +275,42 @@ class ProperNounFilter:
             use_spacy: Use spaCy NER for accurate entity detection
             spacy_model: spaCy model to use (default: en_core_web_sm)
             entity_types: Entity types to filter. Default: PERSON, ORG, GPE, LOC, FAC, NORP
+            prefer_gpu: Switch spaCy to the GPU when one is available (falls
+                back to CPU otherwise). This is a process-wide spaCy setting and
+                only affects models loaded afterwards. Default: False
         """
         self._strategy = strategy
         self._use_spacy = use_spacy
         self._spacy_model_name = spacy_model
         self._entity_types = entity_types or self.DEFAULT_ENTITY_TYPES
+        if use_spacy and prefer_gpu:
+            try:
+                import spacy
+
+                # Allocates on the GPU if one is usable; a no-op (False) otherwise
+                spacy.prefer_gpu()
+            except ImportError:
+                pass
+        # Loaded on first use so constructing a filter stays cheap
         self._nlp: spacy.Language | None = None
+        self._nlp_loaded = False
+
+    def _get_nlp(self) -> spacy.Language | None:
+        """Return the spaCy pipeline, loading it on first call."""
+        if self._use_spacy and not self._nlp_loaded:
+            self._nlp = _load_spacy_model(self._spacy_model_name)
+            self._nlp_loaded = True
+        return self._nlp
 
-        if use_spacy:
-            self._nlp = self._load_spacy_model()
-
-        # Common title words to preserve (not proper nouns)
-        self._common_words = {
-            # English
-            "the",
-            "a",
-            "an",
-            "in",
-            "on",
-            "at",
-            "to",
-            "for",
-            "of",
-            "with",
-            "is",
-            "are",
-            "was",
-            "were",
-            "be",
-            "been",
-            "being",
-            "have",
-            "has",
-            "had",
-            "do",
-            "does",
-            "did",
-            "will",
-            "would",
-            "could",
-            "should",
-            "may",
-            "might",
-            "must",
-            "shall",
-            "can",
-            "need",
-            "dare",
-            "ought",
-            "used",
-            "i",
-            "you",
-            "he",
-            "she",
-            "it",
-            "we",
-            "they",
-            "what",
-            "which",
-            "who",
-            "whom",
-            "this",
-            "that",
-            "these",
-            "those",
-            "am",
-            "and",
-            "or",
-            "but",
-            "if",
-            "then",
-            "else",
-            "when",
-            "where",
-            "why",
-            "how",
-            "all",
-            "each",
-            "every",
-            "both",
-            "few",
-            "more",
-            "most",
-            "other",
-            "some",
-            "such",
-            "no",
-            "nor",
-            "not",
-            "only",
-            "own",
-            "same",
-            "so",
-            "than",
-            "too",
-            "very",
-            "just",
-            "also",
-            "now",
-            "here",
-            "there",
-            # Common words in other languages that might appear capitalized
-            "der",
-            "die",
-            "das",
-            "und",
-            "oder",  # German
-            "le",
-            "la",
-            "les",
-            "et",
-            "ou",  # French
-            "el",
-            "los",
-            "las",
-            "y",
-            "o",  # Spanish
-            "il",
-            "lo",
-            "gli",
-            "e",  # Italian
-        }
-
-        # Pattern for potential proper nouns (capitalized words not at sentence start)
-        self._proper_noun_pattern = re.compile(r"\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b")
-
-    def _load_spacy_model(self) -> spacy.Language | None:
-        """Load spaCy model for NER."""
-        try:
-            import spacy
-
-            return spacy.load(self._spacy_model_name)
-        except (ImportError, OSError):
-            # spaCy not installed or model not found
-            return None
+    @staticmethod
+    def cache_clear() -> None:
+        """Clear the memoized heuristic filter results."""
+        _filter_heuristics.cache_clear()
 
     @property
     def spacy_available(self) -> bool:
         """Check if spaCy NER is available and loaded."""
-        return self._nlp is not None
+        return self._get_nlp() is not None
 
     def filter(self, text: str) -> str:
         """
@@ -195,11 +325,34 @@ class ProperNounFilter:
         if self._strategy == "none":
             return text
 
-        if self._use_spacy and self._nlp is not None:
+        if self._use_spacy and self._get_nlp() is not None:
             return self._filter_with_spacy(text)
 
         return self._filter_with_heuristics(text)
 
+    def filter_batch(self, texts: list[str]) -> list[str]:
+        """
+        Filter proper nouns from several texts.
+
+        With spaCy enabled, all texts go through a single ``nlp.pipe`` call
+        instead of one pipeline invocation per text.
+
+        Args:
+            texts: Input texts
+
+        Returns:
+            Filtered texts, in input order
+        """
+        if self._strategy == "none":
+            return list(texts)
+
+        nlp = self._get_nlp() if self._use_spacy else None
+        if nlp is not None:
+            docs = nlp.pipe(texts, batch_size=_SPACY_BATCH_SIZE)
+            return [self._strip_entities(doc) for doc in docs]
+
+        return [self._filter_with_heuristics(text) for text in texts]
+
     def _filter_with_spacy(self, text: str) -> str:
         """
         spaCy NER-based proper noun filtering.
@@ -207,24 +360,31 @@ class ProperNounFilter:
         Uses named entity recognition to identify and filter entities
         like PERSON, ORG, GPE (geopolitical entity), LOC, etc.
         """
-        if self._nlp is None:
+        nlp = self._get_nlp()
+        if nlp is None:
             return self._filter_with_heuristics(text)
 
-        doc = self._nlp(text)
-        result = text
-
-        # Process entities in reverse order to preserve character positions
-        for ent in reversed(doc.ents):
-            if ent.label_ in self._entity_types:
-                if self._strategy == "mask":
-                    result = result[: ent.start_char] + "[NAME]" + result[ent.end_char :]
-                else:  # remove
-                    # Remove entity and cleanup extra spaces
-                    result = result[: ent.start_char] + result[ent.end_char :]
+        return self._strip_entities(nlp(text))
+
+    def _strip_entities(self, doc: Any) -> str:
+        """Remove or mask the filtered entity types of a parsed doc."""
+        text = doc.text
+        mask = self._strategy == "mask"
+        entity_types = self._entity_types
+
+        # Single left-to-right pass: keep the text between filtered entities
+        pieces: list[str] = []
+        pos = 0
+        for ent in doc.ents:
+            if ent.label_ in entity_types:
+                pieces.append(text[pos : ent.start_char])
+                if mask:
+                    pieces.append("[NAME]")
+                pos = ent.end_char
+        pieces.append(text[pos:])
 
         # Clean up multiple spaces
-        result = re.sub(r"\s+", " ", result).strip()
-        return result
+        return " ".join("".join(pieces).split())
 
     def _filter_with_heuristics(self, text: str) -> str:
         """
@@ -235,49 +395,15 @@ class ProperNounFilter:
         2. Sequences of capitalized words (multi-word names)
         3. Preserve common words that might be capitalized
         """
-        sentences = self._split_sentences(text)
-        filtered_sentences = []
-
-        for sentence in sentences:
-            words = sentence.split()
-            filtered_words = []
-
-            for i, word in enumerate(words):
-                # Check if word is potentially a proper noun
-                clean_word = re.sub(r"[^\w]", "", word).lower()
-
-                is_first_word = i == 0
-                is_capitalized = bool(word) and word[0].isupper()
-                is_common = clean_word in self._common_words
-                is_all_caps = word.isupper() and len(word) > 1
-                is_numeric = any(c.isdigit() for c in word)
-
-                # Keep word if:
-                # - It's lowercase
-                # - It's first word of sentence (capitalization expected)
-                # - It's a common word
-                # - It's an acronym/all caps (might be important)
-                # - It contains numbers
-                if not is_capitalized or is_first_word or is_common or is_numeric:
-                    filtered_words.append(word)
-                elif is_all_caps:
-                    # Might be an acronym, keep it
-                    filtered_words.append(word)
-                elif self._strategy == "mask":
-                    filtered_words.append("[NAME]")
-                # else: remove (don't append)
-
-            if filtered_words:
-                filtered_sentences.append(" ".join(filtered_words))
-
-        return " ".join(filtered_sentences)
-
-    def _split_sentences(self, text: str) -> list[str]:
-        """Simple sentence splitting."""
-        # Split on common sentence endings
-        pattern = r"(?<=[.!?])\s+"
-        sentences = re.split(pattern, text)
-        return [s.strip() for s in sentences if s.strip()]
+        # Nothing can be a capitalized name; only whitespace would change.
+        # Checked before the memo so all-lowercase chat doesn't churn it.
+        # ASCII text gets a regex pre-scan for any token that could be a name
+        # at all ("Hello there, how are you?" has none).
+        if text.lower() == text or (text.isascii() and not _has_mid_sentence_capital(text)):
+            return " ".join(text.split())
+        if len(text) > _MEMO_MAX_CHARS:
+            return _apply_heuristics(text, self._strategy)
+        return _filter_heuristics(text, self._strategy)
 
     def identify_proper_nouns(self, text: str) -> list[str]:
         """
@@ -289,14 +415,15 @@ class ProperNounFilter:
         Returns:
             List of identified proper nouns
         """
-        if self._use_spacy and self._nlp is not None:
-            doc = self._nlp(text)
+        nlp = self._get_nlp()
+        if nlp is not None:
+            doc = nlp(text)
             return [ent.text for ent in doc.ents if ent.label_ in self._entity_types]
 
         # Heuristic approach
-        matches = self._proper_noun_pattern.findall(text)
+        matches = _PROPER_NOUN_RE.findall(text)
         # Filter out sentence starters
-        sentences = self._split_sentences(text)
+        sentences = _split_sentences(text)
         first_words = {s.split()[0] if s.split() else "" for s in sentences}
 
         return [m for m in matches if m not in first_words]
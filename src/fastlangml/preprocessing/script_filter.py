@@ -14,6 +14,7 @@ import unicodedata
 from collections import Counter
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 
 
 class Script(Enum):
@@ -62,6 +63,13 @@ SCRIPT_TO_LANGUAGES: dict[Script, set[str]] = {
     Script.LATIN: set(),  # Too many languages use Latin
 }
 
+# Scripts that narrow the candidate languages (non-empty language sets), so
+# ScriptFilter decides "can this script filter?" with one dict lookup.
+# UNKNOWN, MIXED and LATIN are absent; the sets are shared with the map above.
+_FILTERABLE_SCRIPTS: dict[Script, set[str]] = {
+    script: langs for script, langs in SCRIPT_TO_LANGUAGES.items() if langs
+}
+
 # Unicode ranges for script detection
 SCRIPT_RANGES: dict[Script, list[tuple[int, int]]] = {
     Script.CYRILLIC: [(0x0400, 0x04FF), (0x0500, 0x052F)],
@@ -91,9 +99,48 @@ _SCRIPT_INDEX: list[tuple[int, int, Script]] = sorted(
 _SCRIPT_STARTS: list[int] = [entry[0] for entry in _SCRIPT_INDEX]
 
 
+# Script by table index; _BMP_SCRIPTS stores indexes into this tuple
+_SCRIPTS: tuple[Script, ...] = tuple(Script)
+_SCRIPT_IDS: dict[Script, int] = {script: i for i, script in enumerate(_SCRIPTS)}
+
+
+def _build_bmp_table() -> bytes:
+    """Precompute the script of every Basic Multilingual Plane code point.
+
+    One byte per code point (64 KiB), so classifying a BMP character is a
+    single index instead of a binary search plus the unicodedata fallback.
+    """
+    unknown = _SCRIPT_IDS[Script.UNKNOWN]
+    latin = _SCRIPT_IDS[Script.LATIN]
+    table = bytearray([unknown]) * 0x10000
+
+    for start, end, script in _SCRIPT_INDEX:
+        if start <= 0xFFFF:
+            end = min(end, 0xFFFF)
+            table[start : end + 1] = bytes([_SCRIPT_IDS[script]]) * (end - start + 1)
+
+    # Same Latin fallback as _get_char_script, for letters outside the ranges
+    for code in range(0x10000):
+        if table[code] == unknown:
+            char = chr(code)
+            if char.isalpha() and (char.isascii() or "LATIN" in unicodedata.name(char, "")):
+                table[code] = latin
+
+    return bytes(table)
+
+
+_BMP_SCRIPTS: bytes = _build_bmp_table()
+
+
 def _get_char_script(char: str) -> Script:
-    """Determine the script of a single character using O(log n) binary search."""
+    """Determine the script of a single character.
+
+    BMP characters use the precomputed table; others fall back to an
+    O(log n) binary search over the script ranges.
+    """
     code = ord(char)
+    if code <= 0xFFFF:
+        return _SCRIPTS[_BMP_SCRIPTS[code]]
 
     # Binary search for the script range
     idx = bisect.bisect_right(_SCRIPT_STARTS, code) - 1
@@ -104,9 +151,6 @@ def _get_char_script(char: str) -> Script:
 
     # Check if Latin (fallback for characters not in precomputed ranges)
     if char.isalpha():
-        # Fast path: ASCII letters are Latin
-        if char.isascii():
-            return Script.LATIN
         # Use unicodedata for non-ASCII Latin characters
         try:
             name = unicodedata.name(char, "")
@@ -118,6 +162,22 @@ def _get_char_script(char: str) -> Script:
     return Script.UNKNOWN
 
 
+def _count_scripts(text: str) -> Counter[Script]:
+    """Count the letters of each known script in text.
+
+    Characters are tallied by Counter's C loop first, so each distinct
+    character is classified once however often it repeats.
+    """
+    script_counts: Counter[Script] = Counter()
+    unknown = Script.UNKNOWN
+    for char, count in Counter(text).items():
+        if char.isalpha():
+            script = _get_char_script(char)
+            if script is not unknown:
+                script_counts[script] += count
+    return script_counts
+
+
 def detect_script(text: str) -> tuple[Script, float]:
     """
     Detect the dominant script in a text.
@@ -131,16 +191,15 @@ def detect_script(text: str) -> tuple[Script, float]:
     if not text:
         return Script.UNKNOWN, 0.0
 
-    # Count scripts for each character
-    script_counts: Counter[Script] = Counter()
-    total_chars = 0
+    # Fast path: every ASCII letter is Latin, so ASCII text is all Latin if
+    # it has any letter at all (case mapping changes only letters)
+    if text.isascii():
+        if text.lower() != text.upper():
+            return Script.LATIN, 1.0
+        return Script.UNKNOWN, 0.0
 
-    for char in text:
-        if char.isalpha():
-            script = _get_char_script(char)
-            if script != Script.UNKNOWN:
-                script_counts[script] += 1
-                total_chars += 1
+    script_counts = _count_scripts(text)
+    total_chars = sum(script_counts.values())
 
     if total_chars == 0:
         return Script.UNKNOWN, 0.0
@@ -160,6 +219,37 @@ def detect_script(text: str) -> tuple[Script, float]:
     return Script.UNKNOWN, 0.0
 
 
+# Memoized script questions for ScriptFilter, which often asks several
+# about the same text (filter_languages, is_japanese, is_chinese, ...).
+# Longer texts skip the memo so the process doesn't keep whole documents
+# alive (same bound as DetectionConfig.cache_max_chars).
+_MEMO_MAX_CHARS = 256
+
+_detect_memo = lru_cache(maxsize=1024)(detect_script)
+
+
+def _detect(text: str) -> tuple[Script, float]:
+    """detect_script, memoized for short texts."""
+    if len(text) > _MEMO_MAX_CHARS:
+        return detect_script(text)
+    return _detect_memo(text)
+
+
+def _present(text: str) -> frozenset[Script]:
+    """Known scripts with at least one letter in text."""
+    return frozenset(_count_scripts(text))
+
+
+_scripts_present_memo = lru_cache(maxsize=1024)(_present)
+
+
+def _scripts_present(text: str) -> frozenset[Script]:
+    """Known scripts in text, memoized for short texts."""
+    if len(text) > _MEMO_MAX_CHARS:
+        return _present(text)
+    return _scripts_present_memo(text)
+
+
 @dataclass
 class ScriptFilter:
     """
@@ -185,17 +275,11 @@ class ScriptFilter:
         Returns:
             Filtered set of possible languages, or None if no filtering applied
         """
-        script, proportion = detect_script(text)
-
-        if script in (Script.UNKNOWN, Script.MIXED, Script.LATIN):
-            # Can't filter on Latin (too many languages) or unknown
-            return candidate_languages
+        script, proportion = _detect(text)
 
-        if proportion < self.min_script_proportion:
-            return candidate_languages
-
-        script_langs = SCRIPT_TO_LANGUAGES.get(script, set())
-        if not script_langs:
+        # Can't filter on Latin (too many languages), mixed or unknown
+        script_langs = _FILTERABLE_SCRIPTS.get(script)
+        if script_langs is None or proportion < self.min_script_proportion:
             return candidate_languages
 
         if candidate_languages:
@@ -215,16 +299,10 @@ class ScriptFilter:
         Returns:
             Dict mapping language codes to boost scores, or None
         """
-        script, proportion = detect_script(text)
-
-        if script in (Script.UNKNOWN, Script.MIXED, Script.LATIN):
-            return None
-
-        if proportion < self.min_script_proportion:
-            return None
+        script, proportion = _detect(text)
 
-        script_langs = SCRIPT_TO_LANGUAGES.get(script, set())
-        if not script_langs:
+        script_langs = _FILTERABLE_SCRIPTS.get(script)
+        if script_langs is None or proportion < self.min_script_proportion:
             return None
 
         # Return equal boost for all languages using this script
@@ -233,40 +311,26 @@ class ScriptFilter:
 
     def is_japanese(self, text: str) -> bool:
         """Check if text appears to be Japanese (mix of scripts)."""
-        script_counts: Counter[Script] = Counter()
-
-        for char in text:
-            if char.isalpha():
-                script = _get_char_script(char)
-                script_counts[script] += 1
+        scripts = _scripts_present(text)
 
         # Japanese typically mixes Hiragana, Katakana, and Han
-        has_kana = script_counts[Script.HIRAGANA] > 0 or script_counts[Script.KATAKANA] > 0
-        has_han = script_counts[Script.HAN] > 0
+        has_kana = Script.HIRAGANA in scripts or Script.KATAKANA in scripts
+        has_han = Script.HAN in scripts
 
-        return has_kana or (has_han and not script_counts[Script.HANGUL])
+        return has_kana or (has_han and Script.HANGUL not in scripts)
 
     def is_korean(self, text: str) -> bool:
         """Check if text appears to be Korean."""
-        script, proportion = detect_script(text)
+        script, proportion = _detect(text)
         return script == Script.HANGUL and proportion > 0.3
 
     def is_chinese(self, text: str) -> bool:
         """Check if text appears to be Chinese (Han only, no Kana)."""
-        script_counts: Counter[Script] = Counter()
-
-        for char in text:
-            if char.isalpha():
-                script = _get_char_script(char)
-                script_counts[script] += 1
-
-        total = sum(script_counts.values())
-        if total == 0:
-            return False
+        scripts = _scripts_present(text)
 
-        has_han = script_counts[Script.HAN] > 0
-        has_kana = script_counts[Script.HIRAGANA] > 0 or script_counts[Script.KATAKANA] > 0
-        has_hangul = script_counts[Script.HANGUL] > 0
+        has_han = Script.HAN in scripts
+        has_kana = Script.HIRAGANA in scripts or Script.KATAKANA in scripts
+        has_hangul = Script.HANGUL in scripts
 
         # Chinese uses Han without Kana or Hangul
         return has_han and not has_kana and not has_hangul
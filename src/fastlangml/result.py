@@ -10,7 +10,7 @@ from dataclasses import dataclass, field
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Candidate:
     """A candidate language detection result."""
 
@@ -24,7 +24,7 @@ class Candidate:
     """Mapping of backend name to its confidence for this language."""
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DetectionResult:
     """Result of language detection.
 
@@ -84,6 +84,10 @@ class DetectionResult:
             return self.lang == other.lang
         return NotImplemented
 
+    def __hash__(self) -> int:
+        # Consistent with __eq__, which compares by language code only
+        return hash(self.lang)
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
         result = {
@@ -0,0 +1,50 @@
+"""Shared pytest fixtures."""
+
+import pytest
+
+from fastlangml.backends import get_available_backends
+from fastlangml.exceptions import NoBackendsAvailableError
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_backend_scan():
+    """Probe backend imports once per session.
+
+    get_available_backends() memoizes the built-in import checks, so only
+    the first call pays for importing each backend package. Custom
+    backends are still checked on every call, which the registry tests
+    rely on.
+    """
+    get_available_backends()
+
+
+@pytest.fixture(scope="session")
+def shared_detector():
+    """Create one detector for the whole session so backends load only once.
+
+    The detector is warmed up before it is handed out so lazy imports and
+    model loading are not counted by the first benchmark that uses it.
+    Tests that change its hints or allowed languages must restore them.
+    """
+    from fastlangml import FastLangDetector
+
+    try:
+        detector = FastLangDetector()
+    except NoBackendsAvailableError:
+        pytest.skip("No backends available")
+
+    detector.detect("warm up")
+    detector.detect_batch(["a", "b", "c", "hello", "bonjour"])
+    detector.detect("ok", mode="short")
+    return detector
+
+
+@pytest.fixture(scope="session")
+def shared_codeswitch_detector():
+    """Create one code-switch detector for the whole session."""
+    from fastlangml.codeswitching import CodeSwitchDetector
+
+    try:
+        return CodeSwitchDetector()
+    except Exception:
+        pytest.skip("Code-switch detector not available")
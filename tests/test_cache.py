@@ -0,0 +1,103 @@
+"""Tests for the detection result cache."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from fastlangml.cache import DetectionCache, LRUCache, get_cache, get_detection_cache
+
+
+class TestDetectionCache:
+    """Tests for DetectionCache."""
+
+    def test_get_put(self):
+        """Test storing and retrieving a value."""
+        cache = DetectionCache(max_size=10)
+        cache.put(("ok", "short"), "en")
+
+        assert cache.get(("ok", "short")) == "en"
+        assert cache.get(("missing", "short")) is None
+        assert ("ok", "short") in cache
+
+    def test_evicts_least_recently_used(self):
+        """Test LRU eviction order."""
+        cache = DetectionCache(max_size=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")  # "b" is now the least recently used
+        cache.put("c", 3)
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+        assert len(cache) == 2
+
+    def test_stats(self):
+        """Test hit/miss accounting."""
+        cache = get_detection_cache(max_size=10)
+        cache.put("a", 1)
+        cache.get("a")
+        cache.get("b")
+
+        assert cache.stats() == {"size": 1, "maxsize": 10, "hits": 1, "misses": 1}
+
+        cache.clear()
+        assert cache.stats() == {"size": 0, "maxsize": 10, "hits": 0, "misses": 0}
+
+    def test_get_cache_returns_lru_cache(self):
+        """Test that get_cache keeps returning a cachetools LRUCache."""
+        cache = get_cache(max_size=10)
+        cache["a"] = 1
+
+        assert isinstance(cache, LRUCache)
+        assert cache["a"] == 1
+        assert cache.currsize == 1
+
+    def test_zero_size_disables_cache(self):
+        """Test that max_size=0 stores nothing."""
+        cache = DetectionCache(max_size=0)
+        cache.put("a", 1)
+
+        assert not cache
+        assert cache.get("a") is None
+
+    def test_sharded_cache_bounds_size(self):
+        """Test that a large cache is sharded and stays near max_size."""
+        cache = DetectionCache(max_size=1024, num_shards=16)
+        assert len(cache._shards) == 16
+
+        for i in range(5000):
+            cache.put(f"text {i}", i)
+
+        assert len(cache) <= 1024
+        assert cache.get("text 4999") == 4999
+
+    def test_shard_capacity_matches_max_size(self):
+        """Test that shard capacities add up to exactly max_size."""
+        cache = DetectionCache(max_size=1000, num_shards=16)
+
+        assert sum(shard.maxsize for shard in cache._shards) == 1000
+        assert cache.stats()["maxsize"] == 1000
+
+    def test_small_cache_uses_single_shard(self):
+        """Test that small caches are not split into tiny shards."""
+        assert len(DetectionCache(max_size=10)._shards) == 1
+
+    def test_invalid_shard_count(self):
+        """Test that shard count must be a power of two."""
+        with pytest.raises(ValueError):
+            DetectionCache(max_size=1000, num_shards=3)
+
+    def test_concurrent_access(self):
+        """Test concurrent puts and gets from worker threads."""
+        cache = DetectionCache(max_size=2048)
+
+        def worker(n: int) -> None:
+            for i in range(500):
+                cache.put((n, i), i)
+                cache.get((n, i))
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(worker, range(8)))
+
+        assert cache.hits + cache.misses == 8 * 500
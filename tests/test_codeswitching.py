@@ -1,8 +1,11 @@
 """Tests for code-switching detection."""
 
+import re
+
 import pytest
 
 from fastlangml.codeswitching import (
+    _PAIR_MATCHERS,
     CODE_SWITCH_PATTERNS,
     CodeSwitchDetector,
     CodeSwitchResult,
@@ -108,6 +111,17 @@ class TestCodeSwitchPatterns:
             assert isinstance(patterns, list)
             assert all(isinstance(p, str) for p in patterns)
 
+    def test_pair_matchers_match_source(self):
+        """Test that combined matchers agree with the individual patterns."""
+        assert [pair for pair, _ in _PAIR_MATCHERS] == list(CODE_SWITCH_PATTERNS)
+        samples = ["that's very bueno", "c'est so cool", "main kuch will do", "hello world"]
+        for pair, matcher in _PAIR_MATCHERS:
+            for text in samples:
+                expected = any(
+                    re.search(p, text, re.IGNORECASE) for p in CODE_SWITCH_PATTERNS[pair]
+                )
+                assert bool(matcher.search(text)) == expected
+
 
 class TestDetectCodeSwitchingPattern:
     """Tests for detect_code_switching_pattern function."""
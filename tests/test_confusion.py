@@ -61,6 +61,17 @@ class TestConfusionResolver:
         # Should return original scores since no features match
         assert adjusted == scores
 
+    def test_resolve_shared_feature(self):
+        """Test that a feature listed for both languages boosts both equally."""
+        resolver = ConfusionResolver()
+
+        # "porque" is a feature of both Spanish and Portuguese
+        scores = {"es": 0.45, "pt": 0.42}
+        adjusted = resolver.resolve("porque", scores)
+
+        assert abs(adjusted["es"] - 0.55) < 1e-9
+        assert abs(adjusted["pt"] - 0.52) < 1e-9
+
     def test_get_discriminating_features(self):
         """Test getting discriminating features for language pair."""
         resolver = ConfusionResolver()
@@ -1,5 +1,7 @@
 """Tests for conversation context."""
 
+import pytest
+
 from fastlangml.context.conversation import ConversationContext
 
 
@@ -15,6 +17,45 @@ class TestConversationContext:
         assert context.last_turn is not None
         assert context.last_turn.detected_language == "fr"
 
+    def test_add_turns(self):
+        """Test that add_turns matches repeated add_turn calls."""
+        turns = [(f"Text {i}", ["en", "fr", "es"][i % 3], 0.5 + i / 20) for i in range(8)]
+        bulk = ConversationContext(max_turns=3)
+        bulk.add_turns(turns)
+
+        single = ConversationContext(max_turns=3)
+        for text, lang, conf in turns:
+            single.add_turn(text, lang, conf)
+
+        assert bulk.turns == single.turns
+        assert bulk.language_distribution == pytest.approx(single.language_distribution)
+        assert bulk.dominant_language == single.dominant_language
+        assert bulk.get_language_streak() == single.get_language_streak()
+
+        # A partial batch appends to the existing history
+        bulk.add_turns([("Hola", "es", 0.9)])
+        single.add_turn("Hola", "es", 0.9)
+        assert bulk.turns == single.turns
+        assert bulk.get_language_streak() == single.get_language_streak()
+
+    def test_full_window_fill_breaks_ties_like_add_turn(self):
+        """Test that a batch filling the window breaks weight ties oldest first."""
+        # en decays to 1.0 * 0.9, tying fr at 0.9
+        turns = [("Hello", "en", 1.0), ("Bonjour", "fr", 0.9)]
+        bulk = ConversationContext(max_turns=2, decay_factor=0.9)
+        bulk.add_turns(turns)
+
+        single = ConversationContext(max_turns=2, decay_factor=0.9)
+        for text, lang, conf in turns:
+            single.add_turn(text, lang, conf)
+
+        assert bulk.dominant_language == single.dominant_language == "en"
+        assert list(bulk.language_distribution) == list(single.language_distribution)
+        history = [("en", 1.0), ("fr", 0.9)]
+        for max_turns in (2, 5):
+            ctx = ConversationContext.from_history(history, max_turns=max_turns, decay_factor=0.9)
+            assert ctx.dominant_language == "en"
+
     def test_dominant_language(self):
         """Test dominant language detection."""
         context = ConversationContext()
@@ -24,6 +65,14 @@ class TestConversationContext:
 
         assert context.dominant_language == "fr"
 
+    def test_dominant_language_zero_confidence(self):
+        """Test that turns without confidence don't produce a dominant language."""
+        context = ConversationContext()
+        context.add_turn("Hello", detected_language="en", confidence=0.0)
+
+        assert context.language_distribution == {}
+        assert context.dominant_language is None
+
     def test_language_distribution(self):
         """Test language distribution calculation."""
         context = ConversationContext()
@@ -59,6 +108,19 @@ class TestConversationContext:
         assert lang == "en"
         assert streak == 3
 
+    def test_language_streak_capped_by_window(self):
+        """Test that the streak never exceeds the turns still in the window."""
+        context = ConversationContext(max_turns=3)
+        for _ in range(5):
+            context.add_turn("Bonjour", detected_language="fr", confidence=0.9)
+        assert context.get_language_streak() == ("fr", 3)
+
+        context.add_turn("Hello", detected_language="en", confidence=0.9)
+        assert context.get_language_streak() == ("en", 1)
+
+        context.add_turn("???", detected_language=None)
+        assert context.get_language_streak() == (None, 0)
+
     def test_context_boost(self):
         """Test context boost calculation."""
         context = ConversationContext()
@@ -71,6 +133,46 @@ class TestConversationContext:
         no_boost = context.get_context_boost("es")
         assert no_boost == 0
 
+    def test_distribution_refreshes_after_add_turn(self):
+        """Test that memoized distribution tracks new turns."""
+        context = ConversationContext(max_turns=5)
+        context.add_turn("Hello", detected_language="en", confidence=0.9)
+        assert context.language_distribution == {"en": 1.0}
+        assert context.get_language_streak() == ("en", 1)
+
+        context.add_turn("Bonjour", detected_language="fr", confidence=0.9)
+        assert "fr" in context.language_distribution
+        assert context.get_language_streak() == ("fr", 1)
+
+        # Mutating the returned dict must not affect the context
+        context.language_distribution.clear()
+        assert context.dominant_language == "fr"
+
+    def test_distribution_after_eviction(self):
+        """Test that evicted turns no longer contribute to the distribution."""
+        context = ConversationContext(max_turns=2, decay_factor=0.5)
+        context.add_turn("Hello", detected_language="en", confidence=0.9)
+        context.add_turn("Bonjour", detected_language="fr", confidence=0.6)
+        context.add_turn("Salut", detected_language="fr", confidence=0.8)
+
+        assert context.language_distribution == {"fr": 1.0}
+
+        context.add_turn("Hi", detected_language="en", confidence=0.8)
+        dist = context.language_distribution
+        # fr: 0.8 * 0.5 = 0.4, en: 0.8 -> normalized 1/3 vs 2/3
+        assert abs(dist["fr"] - 1 / 3) < 1e-9
+        assert abs(dist["en"] - 2 / 3) < 1e-9
+
+    def test_context_boost_refreshes_after_add_turn(self):
+        """Test that memoized boosts are recomputed for new turns."""
+        context = ConversationContext(max_turns=5)
+        context.add_turn("Hello", detected_language="en", confidence=0.9)
+        assert context.get_context_boost("fr") == 0
+
+        context.add_turn("Bonjour", detected_language="fr", confidence=0.9)
+        context.add_turn("Salut", detected_language="fr", confidence=0.9)
+        assert context.get_context_boost("fr") > context.get_context_boost("en") > 0
+
     def test_max_turns(self):
         """Test max turns limit."""
         context = ConversationContext(max_turns=3)
@@ -80,20 +182,69 @@ class TestConversationContext:
 
         assert len(context) == 3
 
+    def test_turn_order_after_wrap(self):
+        """Test turn order when max_turns is not a power of two."""
+        context = ConversationContext(max_turns=3)
+
+        for i in range(7):
+            context.add_turn(f"Text {i}", detected_language="en", confidence=0.9)
+
+        assert [t.text for t in context.turns] == ["Text 4", "Text 5", "Text 6"]
+        assert context.last_turn is not None
+        assert context.last_turn.text == "Text 6"
+
+    def test_clone(self):
+        """Test that a clone matches the original and evolves independently."""
+        context = ConversationContext(max_turns=3, decay_factor=0.5)
+        context.add_turn("Hello", detected_language="en", confidence=0.9)
+        context.add_turn("Bonjour", detected_language="fr", confidence=0.8)
+
+        clone = context.clone()
+        assert clone.turns == context.turns
+        assert clone.language_distribution == context.language_distribution
+        assert clone.get_language_streak() == context.get_language_streak()
+
+        clone.add_turn("Salut", detected_language="fr", confidence=0.9)
+        clone.add_turn("Coucou", detected_language="fr", confidence=0.9)
+        assert len(context) == 2
+        assert context.get_language_streak() == ("fr", 1)
+        assert "en" in context.language_distribution
+        assert "en" not in clone.language_distribution
+
+    def test_equality_compares_turns(self):
+        """Test that contexts are equal only with the same settings and turns."""
+        a = ConversationContext(max_turns=2)
+        b = ConversationContext(max_turns=2)
+        a.add_turn("Hello", detected_language="en", confidence=0.9)
+        b.add_turn("Hola", detected_language="es", confidence=0.9)
+        assert a != b
+
+        # Same turns via a different ring-buffer layout still compare equal
+        c = ConversationContext(max_turns=2)
+        for text in ("Hola", "Hello", "Hello"):
+            c.add_turn(text, detected_language="en", confidence=0.9)
+        b.add_turn("Hello", detected_language="en", confidence=0.9)
+        b.clear()
+        b.add_turn("Hello", detected_language="en", confidence=0.9)
+        b.add_turn("Hello", detected_language="en", confidence=0.9)
+        assert b == c
+        assert c.clone() == c
+        assert ConversationContext(max_turns=3) != ConversationContext(max_turns=2)
+
     def test_clear(self):
         """Test clearing context."""
         context = ConversationContext()
         context.add_turn("Hello", detected_language="en", confidence=0.9)
         context.clear()
 
-        assert len(context) == 0
+        assert not context
         assert context.dominant_language is None
 
     def test_empty_context(self):
         """Test empty context."""
         context = ConversationContext()
 
-        assert len(context) == 0
+        assert not context
         assert context.dominant_language is None
         assert context.language_distribution == {}
         assert context.get_language_streak() == (None, 0)
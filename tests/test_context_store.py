@@ -2,7 +2,13 @@
 
 from __future__ import annotations
 
-from fastlangml.context import ConversationContext, ConversationTurn
+import json
+import pickle
+import sys
+
+import pytest
+
+from fastlangml.context import ConversationContext, ConversationTurn, serialization
 
 
 class TestConversationTurnSerialization:
@@ -59,6 +65,23 @@ class TestConversationContextFromHistory:
         assert len(ctx) == 2
         assert ctx.dominant_language == "fr"
 
+    def test_from_history_json_lists(self) -> None:
+        ctx = ConversationContext.from_history(json.loads('[["fr", 0.95], ["en", 0.9]]'))
+        assert len(ctx) == 2
+        assert ctx.get_language_streak() == ("en", 1)
+
+    def test_from_history_returns_independent_contexts(self) -> None:
+        history = [("fr", 0.95), ("fr", 0.9)]
+        first = ConversationContext.from_history(history, max_turns=3)
+        first.add_turn("Hello", "en", 0.9)
+        first.add_turn("Hi", "en", 0.9)
+
+        second = ConversationContext.from_history(history, max_turns=3)
+        assert second is not first
+        assert len(second) == 2
+        assert second.dominant_language == "fr"
+        assert second.get_language_streak() == ("fr", 2)
+
     def test_from_history_dicts(self) -> None:
         ctx = ConversationContext.from_history(
             [
@@ -69,6 +92,12 @@ class TestConversationContextFromHistory:
         assert len(ctx) == 2
         assert ctx.dominant_language == "es"
 
+    def test_from_history_dict_generator(self) -> None:
+        history = ({"lang": lang, "confidence": 0.9} for lang in ("es", "fr", "fr"))
+        ctx = ConversationContext.from_history(history)
+        assert len(ctx) == 3
+        assert ctx.dominant_language == "fr"
+
     def test_from_history_mixed_keys(self) -> None:
         # Supports both "lang" and "detected_language" keys
         ctx = ConversationContext.from_history(
@@ -80,7 +109,7 @@ class TestConversationContextFromHistory:
 
     def test_from_history_empty(self) -> None:
         ctx = ConversationContext.from_history([])
-        assert len(ctx) == 0
+        assert not ctx
         assert ctx.dominant_language is None
 
     def test_from_history_with_config(self) -> None:
@@ -141,7 +170,17 @@ class TestConversationContextSerialization:
         ctx = ConversationContext.from_dict(data)
         assert ctx.max_turns == 2
         assert ctx.decay_factor == 0.9
-        assert len(ctx) == 0
+        assert not ctx
+
+    def test_timestamps_opt_in(self) -> None:
+        ctx = ConversationContext()
+        ctx.add_turn("Hello", "en", 0.9)
+        assert ctx.to_dict()["turns"][0]["timestamp"] == 0.0
+
+        timed = ConversationContext(use_timestamps=True)
+        timed.add_turn("Hello", "en", 0.9)
+        assert timed.to_dict()["turns"][0]["timestamp"] > 0
+        assert ConversationContext.from_dict(timed.to_dict()).use_timestamps is True
 
     def test_round_trip(self) -> None:
         original = ConversationContext(max_turns=5, decay_factor=0.85)
@@ -153,3 +192,39 @@ class TestConversationContextSerialization:
         assert restored.max_turns == 5
         assert restored.decay_factor == 0.85
         assert restored.dominant_language == original.dominant_language
+
+    def test_pickle_round_trip(self) -> None:
+        original = ConversationContext(max_turns=3, decay_factor=0.85)
+        for i, lang in enumerate(["en", "es", "es", "fr"]):
+            original.add_turn(f"Text {i}", lang, 0.9)
+
+        restored = pickle.loads(pickle.dumps(original))
+        assert restored.turns == original.turns
+        assert restored.language_distribution == original.language_distribution
+        assert restored.get_language_streak() == original.get_language_streak()
+        restored.add_turn("Hola", "es", 0.9)
+        assert len(restored) == 3
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_bytes_round_trip(self, monkeypatch: pytest.MonkeyPatch, use_orjson: bool) -> None:
+        if use_orjson and not serialization.HAS_ORJSON:
+            pytest.skip("orjson not installed")
+        monkeypatch.setattr(serialization, "HAS_ORJSON", use_orjson)
+
+        original = ConversationContext(max_turns=5, decay_factor=0.85, use_timestamps=True)
+        original.add_turn("Test", "en", 0.9)
+        original.add_turn("Prueba", "es", 0.85)
+
+        data = original.to_bytes()
+        assert json.loads(data)[3][0][:3] == ["Test", "en", 0.9]
+        restored = ConversationContext.from_bytes(data)
+        assert restored.turns == original.turns
+        assert restored.use_timestamps is True
+        assert restored.language_distribution == original.language_distribution
+
+    def test_decoded_languages_are_interned(self) -> None:
+        data = b'[5, 0.9, false, [["Hi", "en", 0.9, 0.0], ["Hello", "en", 0.8, 0.0]]]'
+        ctx = ConversationContext.from_bytes(data)
+        first, second = ctx.turns
+        assert first.detected_language is sys.intern("en")
+        assert second.detected_language is first.detected_language
@@ -1,5 +1,7 @@
 """Tests for custom backend registration via @backend decorator."""
 
+import dataclasses
+
 import pytest
 
 from fastlangml import (
@@ -13,6 +15,8 @@ from fastlangml import (
 )
 from fastlangml.backends import (
     _BACKEND_RELIABILITY,
+    _BUILTIN_BACKEND_NAMES,
+    _CUSTOM_BACKEND_REGISTRY,
     clear_registered_backends,
     create_backend,
     get_available_backends,
@@ -20,81 +24,90 @@ from fastlangml.backends import (
 from fastlangml.backends.base import DetectionResult
 
 
+def _backend_class(
+    name: str,
+    lang: str,
+    confidence: float = 0.9,
+    *,
+    languages: set[str] | None = None,
+    probabilities: dict[str, float] | None = None,
+) -> type[Backend]:
+    """Build a Backend subclass that always detects lang."""
+    supported = frozenset(languages or {lang})
+
+    return type(
+        "".join(part.title() for part in name.split("_")) + "Backend",
+        (Backend,),
+        {
+            "name": property(lambda self: name),
+            "is_available": property(lambda self: True),
+            "detect": lambda self, text: DetectionResult(
+                name, lang, confidence, all_probabilities=dict(probabilities or {})
+            ),
+            "supported_languages": lambda self: set(supported),
+        },
+    )
+
+
+@pytest.fixture(scope="module")
+def make_backend():
+    """Return a factory that builds and registers a backend via @backend."""
+
+    def make(
+        name: str,
+        lang: str,
+        confidence: float = 0.9,
+        *,
+        reliability: int = 3,
+        languages: set[str] | None = None,
+        probabilities: dict[str, float] | None = None,
+    ) -> type[Backend]:
+        cls = _backend_class(
+            name, lang, confidence, languages=languages, probabilities=probabilities
+        )
+        return backend(name, reliability=reliability)(cls)
+
+    return make
+
+
 @pytest.fixture(autouse=True)
 def cleanup_registry():
-    """Clean up custom backends before and after each test."""
-    clear_registered_backends()
+    """Restore the backend registry to its state before each test."""
+    registry = dict(_CUSTOM_BACKEND_REGISTRY)
+    reliability = dict(_BACKEND_RELIABILITY)
+    default = FastLangDetector._default_instance
     yield
-    clear_registered_backends()
-    FastLangDetector.reset_default()
+    _CUSTOM_BACKEND_REGISTRY.clear()
+    _CUSTOM_BACKEND_REGISTRY.update(registry)
+    _BACKEND_RELIABILITY.clear()
+    _BACKEND_RELIABILITY.update(reliability)
+    # Only a default detector built during the test can hold its custom backends
+    if FastLangDetector._default_instance is not default:
+        FastLangDetector.reset_default()
 
 
 class TestBackendDecorator:
     """Tests for @backend decorator registration."""
 
-    def test_decorator_registers_backend(self):
+    def test_decorator_registers_backend(self, make_backend):
         """Test that @backend decorator registers the class."""
-
-        @backend("test_backend", reliability=4)
-        class TestBackend(Backend):
-            @property
-            def name(self) -> str:
-                return "test_backend"
-
-            @property
-            def is_available(self) -> bool:
-                return True
-
-            def detect(self, text: str) -> DetectionResult:
-                return DetectionResult("test_backend", "en", 0.9)
-
-            def supported_languages(self) -> set[str]:
-                return {"en", "fr"}
+        make_backend("test_backend", "en", reliability=4, languages={"en", "fr"})
 
         assert "test_backend" in list_registered_backends()
         assert _BACKEND_RELIABILITY.get("test_backend") == 4
 
     def test_decorator_returns_class(self):
         """Test that decorator returns the original class."""
-
-        @backend("returnable")
-        class ReturnableBackend(Backend):
-            @property
-            def name(self) -> str:
-                return "returnable"
-
-            @property
-            def is_available(self) -> bool:
-                return True
-
-            def detect(self, text: str) -> DetectionResult:
-                return DetectionResult("returnable", "en", 0.8)
-
-            def supported_languages(self) -> set[str]:
-                return {"en"}
+        cls = _backend_class("returnable", "en", 0.8)
+        assert backend("returnable")(cls) is cls
 
         # Can instantiate the class
-        instance = ReturnableBackend()
+        instance = cls()
         assert instance.name == "returnable"
 
-    def test_decorated_backend_detects(self):
+    def test_decorated_backend_detects(self, make_backend):
         """Test detection using a decorated backend."""
-
-        @backend("french_detector", reliability=5)
-        class FrenchDetector(Backend):
-            @property
-            def name(self) -> str:
-                return "french_detector"
-
-            @property
-            def is_available(self) -> bool:
-                return True
-
-            def detect(self, text: str) -> DetectionResult:
-                return DetectionResult("french_detector", "fr", 0.95)
-
-            def supported_languages(self) -> set[str]:
-                return {"fr"}
+        make_backend("french_detector", "fr", 0.95, reliability=5)
 
         detector = FastLangDetector(config=DetectionConfig(backends=["french_detector"]))
         result = detector.detect("Bonjour")
@@ -104,22 +117,7 @@ class TestBackendDecorator:
 
     def test_decorator_default_reliability(self):
         """Test that default reliability is 3."""
-
-        @backend("default_rel")
-        class DefaultRelBackend(Backend):
-            @property
-            def name(self) -> str:
-                return "default_rel"
-
-            @property
-            def is_available(self) -> bool:
-                return True
-
-            def detect(self, text: str) -> DetectionResult:
-                return DetectionResult("default_rel", "en", 0.5)
-
-            def supported_languages(self) -> set[str]:
-                return {"en"}
+        backend("default_rel")(_backend_class("default_rel", "en", 0.5))
 
         assert _BACKEND_RELIABILITY.get("default_rel") == 3
 
@@ -129,45 +127,14 @@ class TestRegisterBackendFunction:
 
     def test_register_basic(self):
         """Test basic backend registration."""
-
-        class SimpleBackend(Backend):
-            @property
-            def name(self) -> str:
-                return "simple"
-
-            @property
-            def is_available(self) -> bool:
-                return True
-
-            def detect(self, text: str) -> DetectionResult:
-                return DetectionResult("simple", "en", 0.9)
-
-            def supported_languages(self) -> set[str]:
-                return {"en"}
-
-        register_backend("simple", SimpleBackend)
+        register_backend("simple", _backend_class("simple", "en"))
         assert "simple" in list_registered_backends()
 
-    def test_cannot_override_builtin(self):
+    @pytest.mark.parametrize("name", sorted(_BUILTIN_BACKEND_NAMES))
+    def test_cannot_override_builtin(self, name):
         """Test that built-in backends cannot be overridden."""
-
-        class FakeBackend(Backend):
-            @property
-            def name(self) -> str:
-                return "fasttext"
-
-            @property
-            def is_available(self) -> bool:
-                return True
-
-            def detect(self, text: str) -> DetectionResult:
-                return DetectionResult("fasttext", "en", 0.9)
-
-            def supported_languages(self) -> set[str]:
-                return {"en"}
-
         with pytest.raises(ValueError, match="conflicts with built-in"):
-            register_backend("fasttext", FakeBackend)
+            register_backend(name, _backend_class(name, "en"))
 
     def test_invalid_backend_class(self):
         """Test that non-Backend classes are rejected."""
@@ -176,21 +143,7 @@ class TestRegisterBackendFunction:
 
     def test_invalid_reliability(self):
         """Test that invalid reliability scores are rejected."""
-
-        class ValidBackend(Backend):
-            @property
-            def name(self) -> str:
-                return "valid"
-
-            @property
-            def is_available(self) -> bool:
-                return True
-
-            def detect(self, text: str) -> DetectionResult:
-                return DetectionResult("valid", "en", 0.9)
-
-            def supported_languages(self) -> set[str]:
-                return {"en"}
+        ValidBackend = _backend_class("valid", "en")
 
         with pytest.raises(ValueError, match="must be 1-5"):
             register_backend("valid", ValidBackend, reliability=0)
@@ -202,24 +155,9 @@ class TestRegisterBackendFunction:
 class TestUnregisterBackend:
     """Tests for unregister_backend function."""
 
-    def test_unregister_existing(self):
+    def test_unregister_existing(self, make_backend):
         """Test unregistering an existing backend."""
-
-        @backend("removable")
-        class RemovableBackend(Backend):
-            @property
-            def name(self) -> str:
-                return "removable"
-
-            @property
-            def is_available(self) -> bool:
-                return True
-
-            def detect(self, text: str) -> DetectionResult:
-                return DetectionResult("removable", "en", 0.9)
-
-            def supported_languages(self) -> set[str]:
-                return {"en"}
+        make_backend("removable", "en")
 
         assert "removable" in list_registered_backends()
 
@@ -233,75 +171,52 @@ class TestUnregisterBackend:
         result = unregister_backend("nonexistent")
         assert result is False
 
-    def test_cannot_unregister_builtin(self):
+    def test_clear_registered_backends(self, make_backend):
+        """Test removing every custom backend at once."""
+        make_backend("first", "en")
+        make_backend("second", "fr")
+
+        clear_registered_backends()
+
+        assert list_registered_backends() == []
+        assert "first" not in _BACKEND_RELIABILITY
+        assert "fasttext" in _BACKEND_RELIABILITY
+
+    @pytest.mark.parametrize("name", sorted(_BUILTIN_BACKEND_NAMES))
+    def test_cannot_unregister_builtin(self, name):
         """Test that built-in backends cannot be unregistered."""
         with pytest.raises(ValueError, match="Cannot unregister built-in"):
-            unregister_backend("fasttext")
+            unregister_backend(name)
 
 
 class TestCustomBackendInEnsemble:
     """Tests for using custom backends in ensemble detection."""
 
-    def test_custom_backend_in_available_list(self):
+    def test_custom_backend_in_available_list(self, make_backend):
         """Test that custom backend appears in available list."""
-
-        @backend("available_test")
-        class AvailableBackend(Backend):
-            @property
-            def name(self) -> str:
-                return "available_test"
-
-            @property
-            def is_available(self) -> bool:
-                return True
-
-            def detect(self, text: str) -> DetectionResult:
-                return DetectionResult("available_test", "en", 0.9)
-
-            def supported_languages(self) -> set[str]:
-                return {"en"}
+        make_backend("available_test", "en")
 
         available = get_available_backends()
         assert "available_test" in available
 
-    def test_ensemble_with_custom_backends(self):
+    def test_ensemble_with_custom_backends(self, make_backend):
         """Test ensemble voting with multiple custom backends."""
-
-        @backend("english_voter", reliability=3)
-        class EnglishVoter(Backend):
-            @property
-            def name(self) -> str:
-                return "english_voter"
-
-            @property
-            def is_available(self) -> bool:
-                return True
-
-            def detect(self, text: str) -> DetectionResult:
-                return DetectionResult(
-                    "english_voter", "en", 0.9, all_probabilities={"en": 0.9, "fr": 0.1}
-                )
-
-            def supported_languages(self) -> set[str]:
-                return {"en", "fr"}
-
-        @backend("french_voter", reliability=5)
-        class FrenchVoter(Backend):
-            @property
-            def name(self) -> str:
-                return "french_voter"
-
-            @property
-            def is_available(self) -> bool:
-                return True
-
-            def detect(self, text: str) -> DetectionResult:
-                return DetectionResult(
-                    "french_voter", "fr", 0.95, all_probabilities={"fr": 0.95, "en": 0.05}
-                )
-
-            def supported_languages(self) -> set[str]:
-                return {"en", "fr"}
+        make_backend(
+            "english_voter",
+            "en",
+            0.9,
+            reliability=3,
+            languages={"en", "fr"},
+            probabilities={"en": 0.9, "fr": 0.1},
+        )
+        make_backend(
+            "french_voter",
+            "fr",
+            0.95,
+            reliability=5,
+            languages={"en", "fr"},
+            probabilities={"fr": 0.95, "en": 0.05},
+        )
 
         detector = FastLangDetector(
             config=DetectionConfig(
@@ -314,6 +229,24 @@ class TestCustomBackendInEnsemble:
         result = detector.detect("Hello")
         assert result.backend == "ensemble"
 
+    def test_candidate_backend_votes(self, make_backend):
+        """Test that each candidate lists the backends that voted for it."""
+        make_backend("french_a", "fr", 0.9)
+        make_backend("french_b", "fr", 0.8)
+        make_backend("english_c", "en", 0.7)
+
+        detector = FastLangDetector(
+            config=DetectionConfig(
+                backends=["french_a", "french_b", "english_c"],
+                voting_strategy="hard",
+            )
+        )
+        result = detector.detect("Bonjour tout le monde", top_k=2)
+
+        assert result.lang == "fr"
+        votes = {c.lang: c.backend_votes for c in result.candidates}
+        assert votes == {"fr": {"french_a": 0.9, "french_b": 0.8}, "en": {"english_c": 0.7}}
+
 
 class TestBackendInterface:
     """Tests verifying the Backend interface."""
@@ -346,3 +279,13 @@ class TestBackendInterface:
         assert results[0].language == "en"
         assert results[1].language == "fr"
         assert results[2].language == "en"
+
+    def test_detection_result_normalized_and_frozen(self):
+        """Test that backend results normalize their language and are immutable."""
+        result = DetectionResult("frozen_test", "EN", 0.8)
+
+        assert result.language == "en"
+        assert result.all_probabilities == {"en": 0.8}
+        assert not hasattr(result, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            result.language = "fr"  # type: ignore[misc]
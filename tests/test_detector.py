@@ -1,5 +1,7 @@
 """Tests for main detector."""
 
+import dataclasses
+
 import pytest
 
 from fastlangml.context.conversation import ConversationContext
@@ -12,63 +14,90 @@ from fastlangml.exceptions import NoBackendsAvailableError
 from fastlangml.hints.dictionary import HintDictionary
 from fastlangml.result import DetectionResult
 
+# (text, expected language) samples every backend combination should get right
+_SAMPLES = [
+    ("Hello, how are you today?", "en"),
+    ("Bonjour, comment allez-vous?", "fr"),
+    ("Hola, como estas?", "es"),
+    ("Guten Tag, wie geht es Ihnen?", "de"),
+]
+
+
+def _build(builder, reason="No backends available"):
+    """Build a detector, skipping the test when its backends aren't installed."""
+    try:
+        return builder.build()
+    except NoBackendsAvailableError:
+        pytest.skip(reason)
+
+
+def _assert_detection(result, lang=None, *, candidates=False):
+    """Assert result is a DetectionResult, optionally with lang and a candidates list."""
+    assert isinstance(result, DetectionResult)
+    if lang is not None:
+        assert result.lang == lang
+    if candidates:
+        assert isinstance(result.candidates, list)
+
 
 class TestFastLangDetector:
     """Tests for FastLangDetector."""
 
     @pytest.fixture
-    def detector(self):
-        """Create a detector for testing."""
-        # Skip if no backends available
-        try:
-            return FastLangDetector()
-        except NoBackendsAvailableError:
-            pytest.skip("No backends available")
-
-    def test_detect_french(self, detector):
-        """Test detecting French."""
-        result = detector.detect("Bonjour, comment allez-vous?")
-        assert isinstance(result, DetectionResult)
-        assert result.lang == "fr"
-
-    def test_detect_spanish(self, detector):
-        """Test detecting Spanish."""
-        result = detector.detect("Hola, como estas?")
-        assert isinstance(result, DetectionResult)
-        assert result.lang == "es"
-
-    def test_detect_german(self, detector):
-        """Test detecting German."""
-        result = detector.detect("Guten Tag, wie geht es Ihnen?")
-        assert isinstance(result, DetectionResult)
-        assert result.lang == "de"
+    def detector(self, shared_detector):
+        """Use the session-wide detector so backends load only once."""
+        return shared_detector
+
+    @pytest.fixture(autouse=True)
+    def _restore_detector(self, detector):
+        """Undo hint and language changes a test makes to the shared detector."""
+        hints = detector.hints.to_dict()
+        allowed = detector.allowed_languages
+        yield
+        for word in detector.hints.words():
+            detector.remove_hint(word)
+        detector.hints.add_many(hints)
+        detector.set_languages(list(allowed) if allowed else None)
 
     def test_detect_top_k(self, detector):
         """Test getting top-k results."""
-        result = detector.detect("Hello world", top_k=3)
-        assert isinstance(result, DetectionResult)
         # top_k > 1 populates candidates list
-        assert isinstance(result.candidates, list)
+        _assert_detection(detector.detect("Hello world", top_k=3), candidates=True)
 
     def test_detect_short_mode(self, detector):
         """Test short mode for tiny strings."""
-        result = detector.detect("Hi", mode="short")
-        assert isinstance(result, DetectionResult)
         # Should return something (might be 'und' for too short)
+        _assert_detection(detector.detect("Hi", mode="short"))
 
     def test_detect_batch(self, detector):
         """Test batch detection."""
         texts = ["Hello", "Bonjour", "Hola"]
         results = detector.detect_batch(texts)
         assert len(results) == 3
-        assert all(isinstance(r, DetectionResult) for r in results)
+        for result in results:
+            _assert_detection(result)
+
+    def test_detect_batch_multilingual(self, detector):
+        """Test that one batch call detects every sample language."""
+        results = detector.detect_batch([text for text, _ in _SAMPLES])
+        assert len(results) == len(_SAMPLES)
+        for (text, lang), result in zip(_SAMPLES, results, strict=True):
+            _assert_detection(result)
+            assert result.lang == lang, text
+
+    def test_detect_batch_parallel_backends(self, detector):
+        """Test batch detection of texts long enough to run backends in parallel."""
+        texts = ["Bonjour, comment allez-vous aujourd'hui?"] * 16
+        results = detector.detect_batch(texts)
+        assert len(results) == 16
+        assert all(r.lang == "fr" for r in results)
 
     def test_set_languages(self, detector):
         """Test setting allowed languages."""
         detector.set_languages(["en", "fr"])
 
         result = detector.detect("Hello world")
-        assert isinstance(result, DetectionResult)
+        _assert_detection(result)
         assert result.lang in ["en", "fr", "und"]
 
     def test_add_hint(self, detector):
@@ -89,7 +118,7 @@ class TestFastLangDetector:
         context.add_turn("Comment ca va?", detected_language="fr", confidence=0.9)
 
         result = detector.detect("Tres bien!", context=context)
-        assert isinstance(result, DetectionResult)
+        _assert_detection(result)
         # Context should help identify French
         assert result.lang is not None
 
@@ -98,17 +127,31 @@ class TestFastLangDetector:
         hints = HintDictionary()
         hints.add("bonjour", "fr")
 
-        result = detector.detect("Bonjour!", hints=hints)
-        assert isinstance(result, DetectionResult)
-        assert result.lang == "fr"
+        _assert_detection(detector.detect("Bonjour!", hints=hints), "fr")
 
     def test_empty_text(self, detector):
         """Test with empty text."""
         result = detector.detect("")
-        assert isinstance(result, DetectionResult)
-        assert result.lang == "und"
+        _assert_detection(result, "und")
         assert result.reason is not None
 
+    def test_cache_skips_long_text(self):
+        """Test that texts over cache_max_chars bypass the result cache."""
+        cache_max_chars = 64
+        try:
+            detector = FastLangDetector(config=DetectionConfig(cache_max_chars=cache_max_chars))
+        except NoBackendsAvailableError:
+            pytest.skip("No backends available")
+
+        detector.detect("Bonjour, comment allez-vous?")
+        size = detector.cache_stats["size"]
+        assert size > 0
+
+        long_text = "This is a test sentence in English. " * 3
+        assert len(long_text) > cache_max_chars
+        detector.detect(long_text)
+        assert detector.cache_stats["size"] == size
+
     def test_available_backends(self, detector):
         """Test getting available backends."""
         backends = detector.available_backends
@@ -121,47 +164,31 @@ class TestFastLangDetectorBuilder:
 
     def test_build_default(self):
         """Test building with defaults."""
-        try:
-            detector = FastLangDetectorBuilder().build()
-            assert isinstance(detector, FastLangDetector)
-        except NoBackendsAvailableError:
-            pytest.skip("No backends available")
+        assert isinstance(_build(FastLangDetectorBuilder()), FastLangDetector)
 
     def test_with_backends(self):
         """Test specifying backends."""
         builder = FastLangDetectorBuilder().with_backends("langdetect")
-        try:
-            detector = builder.build()
-            assert "langdetect" in detector.available_backends
-        except NoBackendsAvailableError:
-            pytest.skip("langdetect not available")
+        detector = _build(builder, "langdetect not available")
+        assert "langdetect" in detector.available_backends
 
     def test_with_voting_strategy(self):
         """Test setting voting strategy."""
-        try:
-            detector = FastLangDetectorBuilder().with_voting_strategy("hard").build()
-            assert isinstance(detector, FastLangDetector)
-        except NoBackendsAvailableError:
-            pytest.skip("No backends available")
+        detector = _build(FastLangDetectorBuilder().with_voting_strategy("hard"))
+        assert isinstance(detector, FastLangDetector)
 
     def test_with_proper_noun_filtering(self):
         """Test setting proper noun filtering."""
-        try:
-            detector = FastLangDetectorBuilder().with_proper_noun_filtering("mask").build()
-            assert isinstance(detector, FastLangDetector)
-        except NoBackendsAvailableError:
-            pytest.skip("No backends available")
+        detector = _build(FastLangDetectorBuilder().with_proper_noun_filtering("mask"))
+        assert isinstance(detector, FastLangDetector)
 
     def test_with_hints(self):
         """Test providing hints."""
         hints = HintDictionary()
         hints.add("bonjour", "fr")
 
-        try:
-            detector = FastLangDetectorBuilder().with_hints(hints).build()
-            assert "bonjour" in detector.hints
-        except NoBackendsAvailableError:
-            pytest.skip("No backends available")
+        detector = _build(FastLangDetectorBuilder().with_hints(hints))
+        assert "bonjour" in detector.hints
 
 
 class TestDetectionConfig:
@@ -209,3 +236,12 @@ class TestDetectionResult:
         repr_str = repr(result)
         assert "und" in repr_str
         assert "too_little_text" in repr_str
+
+    def test_immutable_and_hashable(self):
+        """Test that results are frozen and hash like their language code."""
+        result = DetectionResult(lang="en", confidence=0.9)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            result.lang = "fr"  # type: ignore[misc]
+        assert result == "en"
+        assert hash(result) == hash("en")
+        assert len({result, DetectionResult(lang="en", confidence=0.5)}) == 1
@@ -5,15 +5,23 @@ import pytest
 from fastlangml.hints.dictionary import HintDictionary
 
 
+@pytest.fixture(scope="module")
+def base_hints():
+    """Hints shared by the read-only tests."""
+    return {"bonjour": "fr", "gracias": "es", "merci": "fr", "hola": "es"}
+
+
+@pytest.fixture
+def hints(base_hints):
+    """A fresh dictionary populated from base_hints."""
+    return HintDictionary.from_dict(base_hints)
+
+
 class TestHintDictionary:
     """Tests for HintDictionary."""
 
-    def test_add_and_get(self):
+    def test_add_and_get(self, hints):
         """Test adding and getting hints."""
-        hints = HintDictionary()
-        hints.add("bonjour", "fr")
-        hints.add("gracias", "es")
-
         assert hints.get("bonjour") == "fr"
         assert hints.get("gracias") == "es"
         assert hints.get("hello") is None
@@ -35,22 +43,15 @@ class TestHintDictionary:
         assert hints.get("Bonjour") == "fr"
         assert hints.get("bonjour") is None
 
-    def test_lookup_text(self):
+    def test_lookup_text(self, hints):
         """Test looking up hints in text."""
-        hints = HintDictionary()
-        hints.add("bonjour", "fr")
-        hints.add("merci", "fr")
-
         result = hints.lookup("Bonjour, merci beaucoup!")
         assert result is not None
         assert result[0] == "fr"
         assert result[1] > 0
 
-    def test_lookup_no_match(self):
+    def test_lookup_no_match(self, hints):
         """Test lookup with no matches."""
-        hints = HintDictionary()
-        hints.add("bonjour", "fr")
-
         result = hints.lookup("Hello world")
         assert result is None
 
@@ -61,7 +62,7 @@ class TestHintDictionary:
         hints.remove("bonjour")
 
         assert hints.get("bonjour") is None
-        assert len(hints) == 0
+        assert not hints
 
     def test_merge(self):
         """Test merging dictionaries."""
@@ -102,12 +103,8 @@ class TestHintDictionary:
         with pytest.raises(ValueError):
             hints.add("hello world", "en")  # Contains space
 
-    def test_lookup_all(self):
+    def test_lookup_all(self, hints):
         """Test looking up all matches."""
-        hints = HintDictionary()
-        hints.add("bonjour", "fr")
-        hints.add("hola", "es")
-
         result = hints.lookup_all("Bonjour! Hola!")
         assert "fr" in result
         assert "es" in result
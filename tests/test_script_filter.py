@@ -3,6 +3,7 @@
 from fastlangml.preprocessing.script_filter import (
     Script,
     ScriptFilter,
+    _detect_memo,
     detect_script,
 )
 
@@ -70,6 +71,23 @@ class TestDetectScript:
         assert script == Script.HIRAGANA
         assert proportion > 0.9
 
+    def test_ascii_without_letters(self):
+        """Test that ASCII digits and punctuation have no script."""
+        assert detect_script("123 + 456 = ?") == (Script.UNKNOWN, 0.0)
+        assert detect_script("42 km") == (Script.LATIN, 1.0)
+
+    def test_accented_latin(self):
+        """Test that non-ASCII Latin letters count as Latin."""
+        script, proportion = detect_script("Ça été très réussi")
+        assert script == Script.LATIN
+        assert proportion == 1.0
+
+    def test_han_outside_bmp(self):
+        """Test Han characters beyond the Basic Multilingual Plane."""
+        script, proportion = detect_script("\U00020000\U00020001你好")
+        assert script == Script.HAN
+        assert proportion == 1.0
+
     def test_mixed_scripts(self):
         """Test mixed script detection."""
         script, proportion = detect_script("Hello Привет مرحبا")
@@ -143,3 +161,23 @@ class TestScriptFilter:
         assert filter.is_chinese("你好世界")
         # Japanese text with kana should not be Chinese
         assert not filter.is_chinese("こんにちは")
+
+    def test_repeated_text_uses_cache(self):
+        """Test that script questions about the same text share one detection."""
+        filter = ScriptFilter()
+        text = "Привет, как дела?"
+        filter.filter_languages(text)
+
+        hits = _detect_memo.cache_info().hits
+        assert filter.get_script_hint(text) is not None
+        assert not filter.is_korean(text)
+        assert _detect_memo.cache_info().hits == hits + 2
+
+    def test_long_text_skips_cache(self):
+        """Test that long texts are not kept in the script memo."""
+        filter = ScriptFilter()
+        text = "Привет, как дела? " * 20
+        _detect_memo.cache_clear()
+
+        assert filter.filter_languages(text) is not None
+        assert _detect_memo.cache_info().currsize == 0